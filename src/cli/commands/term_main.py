@@ -113,7 +113,6 @@ def connect_to_terminal(args):
     print_message('connecting_repository', 'HEADER', repository=args.repository, machine=args.machine)
 
     from cli.core.shared import validate_machine_accessibility, handle_ssh_exit_code
-    from cli.core.config import get_logger
     logger = get_logger(__name__)
 
     conn = RepositoryConnection(args.team, args.machine, args.repository); conn.connect()
@@ -121,12 +120,9 @@ def connect_to_terminal(args):
     validate_machine_accessibility(args.machine, args.team, conn.connection_info['ip'], port, args.repository)
 
     # DEBUG: Log terminal connection details
-    logger.debug(f"[connect_to_terminal] Terminal connection details:")
-    logger.debug(f"  - Team: {args.team}")
-    logger.debug(f"  - Machine: {args.machine}")
-    logger.debug(f"  - Repository: {args.repository}")
-    logger.debug(f"  - repository_guid: {conn.repository_guid}")
-    logger.debug(f"  - mount_path: {conn.repository_paths['mount_path']}")
+    logger.debug("[connect_to_terminal] Terminal connection details:\n"
+                 "  - Team: %s\n  - Machine: %s\n  - Repository: %s\n  - repository_guid: %s\n  - mount_path: %s",
+                 args.team, args.machine, args.repository, conn.repository_guid, conn.repository_paths['mount_path'])
 
     ssh_key = get_ssh_key_from_vault(args.team)
     if not ssh_key:
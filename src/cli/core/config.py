@@ -117,6 +117,22 @@ def get_ssh_control_dir() -> Path:
     return ssh_dir
 
 
+def get_ssh_sockets_dir() -> Path:
+    """Get the private directory holding OpenSSH ControlMaster sockets"""
+    sockets_dir = get_config_dir() / 'ssh-sockets'
+    sockets_dir.mkdir(mode=0o700, exist_ok=True)
+    with contextlib.suppress(OSError, NotImplementedError):
+        sockets_dir.chmod(0o700)
+    return sockets_dir
+
+
+def get_telemetry_spool_dir() -> Path:
+    """Get the private directory where exiting CLI processes leave unsent telemetry"""
+    spool_dir = get_config_dir() / 'telemetry-spool'
+    spool_dir.mkdir(mode=0o700, exist_ok=True)
+    return spool_dir
+
+
 # ============================================================================
 # LOGGING CONFIG MODULE (from logging_config.py)
 # ============================================================================
@@ -588,7 +604,6 @@ class TokenManager:
     @classmethod
     def _save_config(cls, config: Dict[str, Any]):
         import platform
-        import shutil
         
         # Create a file lock for config operations
         config_lock_file = cls._config_dir / '.config.lock'
@@ -608,10 +623,8 @@ class TokenManager:
                             with open(temp_file, 'w') as f: json.dump(config, f, indent=2)
                             if not is_windows: temp_file.chmod(0o600)
                             
-                            if is_windows and cls._config_file.exists():
-                                with contextlib.suppress(OSError): cls._config_file.unlink()
-                            
-                            shutil.move(str(temp_file), str(cls._config_file)) if is_windows else temp_file.replace(cls._config_file)
+                            # os.replace overwrites atomically on Windows too, so a crash never leaves the config missing
+                            os.replace(temp_file, cls._config_file)
                             if not is_windows: cls._config_file.chmod(0o600)
                             return
                             
@@ -2342,6 +2355,7 @@ __all__ = [
     'get_api_lock_file',
     'get_token_lock_file',
     'get_ssh_control_dir',
+    'get_ssh_sockets_dir',
     
     # Logging functions
     'setup_logging',
@@ -62,6 +62,14 @@ class EnvironmentConfig:
         """Get environment variable with fallback to defaults"""
         return os.environ.get(key, cls.ENV_DEFAULTS.get(key, default))
     
+    @staticmethod
+    def _parse_vault_json(vault_json: str) -> Any:
+        """json.loads for vault JSON that may arrive shell-escaped"""
+        # Handle escaped JSON strings from shell
+        if vault_json.startswith('{') and '\\' in vault_json:
+            vault_json = vault_json.replace('\\"', '"').replace('\\\\', '\\')
+        return json.loads(vault_json)
+
     @classmethod
     def get_organization_vault_defaults(cls) -> Dict[str, Any]:
         """Parse SYSTEM_ORGANIZATION_VAULT_DEFAULTS from environment or use defaults"""
@@ -71,11 +79,7 @@ class EnvironmentConfig:
             return cls.DEFAULT_ORGANIZATION_VAULT.copy()
 
         try:
-            # Handle escaped JSON strings from shell
-            if vault_json.startswith('{') and '\\' in vault_json:
-                vault_json = vault_json.replace('\\"', '"').replace('\\\\', '\\')
-
-            vault_data = json.loads(vault_json)
+            vault_data = cls._parse_vault_json(vault_json)
 
             # Ensure essential fields with defaults
             for key in ['UNIVERSAL_USER_ID', 'UNIVERSAL_USER_NAME']:
@@ -101,6 +105,23 @@ class EnvironmentConfig:
                 vault.get('UNIVERSAL_USER_ID', '7111'),
                 vault.get('ORGANIZATION_ID'))
     
+    @classmethod
+    def get_explicit_universal_user_info(cls) -> Optional[Tuple[str, str, str]]:
+        """Get universal user info only if the environment sets all three values itself.
+        Returns None when any of them would come from the built-in defaults.
+        """
+        vault_json = os.environ.get('SYSTEM_ORGANIZATION_VAULT_DEFAULTS')
+        if not vault_json:
+            return None
+        try:
+            vault_data = cls._parse_vault_json(vault_json)
+        except (json.JSONDecodeError, TypeError):
+            return None  # get_organization_vault_defaults() reports it on the regular path
+        if not isinstance(vault_data, dict) or not (vault_data.get('UNIVERSAL_USER_NAME') and vault_data.get('UNIVERSAL_USER_ID')):
+            return None
+        info = cls.get_universal_user_info()
+        return info if all(info) else None
+    
     @classmethod
     def get_universal_user_name(cls) -> str:
         """Get universal user name with guaranteed fallback"""
@@ -5,6 +5,7 @@ Provides centralized logic for calculating repository-specific environment varia
 Used by: rediacc-term, rediacc vscode, GUI integrations.
 """
 
+import logging
 import sys
 from typing import Dict, Optional
 from .config import get_logger, TokenManager
@@ -93,9 +94,9 @@ def get_repository_environment(
         'UNIVERSAL_USER_NAME': universal_user_name or '',
     }
 
-    logger.debug(f"[get_repository_environment] Generated environment for {team}/{machine}/{repository}:")
-    for key, value in env_vars.items():
-        logger.debug(f"  {key}={value}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[get_repository_environment] Generated environment for %s/%s/%s:\n%s", team, machine, repository,
+                     "\n".join(f"  {key}={value}" for key, value in env_vars.items()))
 
     return env_vars
 
@@ -137,9 +138,9 @@ def get_machine_environment(
         'REDIACC_DATASTORE': datastore_path,
     }
 
-    logger.debug(f"[get_machine_environment] Generated environment for {team}/{machine}:")
-    for key, value in env_vars.items():
-        logger.debug(f"  {key}={value}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[get_machine_environment] Generated environment for %s/%s:\n%s", team, machine,
+                     "\n".join(f"  {key}={value}" for key, value in env_vars.items()))
 
     return env_vars
 
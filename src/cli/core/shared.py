@@ -1,22 +1,43 @@
 #!/usr/bin/env python3
+import atexit
+import contextlib
+import errno
+import functools
 import json
+import logging
 import os
 import subprocess
 import sys
 import tempfile
 import platform
+import re
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from .config import (
-    get_config_dir, get_main_config_file,
+    get_config_dir, get_ssh_sockets_dir,
     TokenManager,
     get, get_required, get_path,
-    is_encrypted
+    is_encrypted, get_logger
 )
+from .env_config import EnvironmentConfig
+from .telemetry import get_telemetry_service, telemetry_opted_out
+
+# Optional: orjson decodes large vault payloads several times faster. Its
+# JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = get_logger(__name__)
 
 CLI_TOOL = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'commands', 'cli_main.py')
 
+@functools.lru_cache(maxsize=None)
 def is_pypi_installation() -> bool:
     """
     Detect if this is a PyPI installation (site-packages) vs development installation.
@@ -24,9 +45,9 @@ def is_pypi_installation() -> bool:
     Returns:
         True if installed via pip (in site-packages), False if running from source
     """
-    cli_tool_path = Path(CLI_TOOL).resolve()
+    cli_tool_path = str(Path(CLI_TOOL).resolve())
     # Check if the path contains 'site-packages' - indicates PyPI installation
-    return 'site-packages' in str(cli_tool_path) or 'dist-packages' in str(cli_tool_path)
+    return 'site-packages' in cli_tool_path or 'dist-packages' in cli_tool_path
 
 def get_organization_short(organization_id: str) -> str:
     """
@@ -38,11 +59,17 @@ def get_organization_short(organization_id: str) -> str:
     else:
         return organization_id  # Use as-is if not GUID-like
 
+# Read once at import; timed call sites skip their clock reads when telemetry is off
+_TELEMETRY_ENABLED = not telemetry_opted_out()
+
 def _track_ssh_operation(operation: str, host: str = "unknown", success: bool = True,
                         duration_ms: Optional[float] = None, error: Optional[str] = None, **kwargs):
-    """Helper function to track SSH operations with telemetry"""
+    """Helper function to track SSH operations with telemetry.
+    Events are queued for the telemetry worker thread; the caller doesn't wait for them to be sent.
+    """
+    if not _TELEMETRY_ENABLED:
+        return
     try:
-        from .telemetry import get_telemetry_service
         telemetry = get_telemetry_service()
         telemetry.track_ssh_operation(operation, host, success, duration_ms, error)
     except Exception:
@@ -60,11 +87,15 @@ def get_cli_command() -> list:
     """
     return [sys.executable, CLI_TOOL]
 
+# The platform and install location don't change while the process runs
+_IS_WINDOWS = platform.system().lower() == 'windows'
+_NULL_DEVICE = 'NUL' if _IS_WINDOWS else '/dev/null'
+
 def is_windows() -> bool:
-    return platform.system().lower() == 'windows'
+    return _IS_WINDOWS
 
 def get_null_device() -> str:
-    return 'NUL' if is_windows() else '/dev/null'
+    return _NULL_DEVICE
 
 def create_temp_file(suffix: str = '', prefix: str = 'tmp', delete: bool = True) -> str:
     if not is_windows():
@@ -75,6 +106,31 @@ def create_temp_file(suffix: str = '', prefix: str = 'tmp', delete: bool = True)
     fd, path = tempfile.mkstemp(suffix=suffix, prefix=prefix, dir=temp_dir)
     os.close(fd); return path
 
+@functools.lru_cache(maxsize=None)
+def _windows_user() -> Optional[str]:
+    """Login name used for Windows ACL grants, looked up once per process"""
+    try:
+        return os.getlogin()
+    except OSError:
+        return os.environ.get('USERNAME')
+
+def _restrict_windows_acl(path: str, inherit: bool = False) -> bool:
+    """Strip inherited ACEs from path and grant full control to the current user only.
+
+    With inherit=True the grant is inheritable, so files later created inside
+    a directory get the owner-only ACL without another icacls call.
+    """
+    user = _windows_user()
+    if not user:
+        return False
+    grant = f'{user}:(OI)(CI)F' if inherit else f'{user}:F'
+    try:
+        result = subprocess.run(['icacls', path, '/inheritance:r', '/grant:r', grant],
+                                capture_output=True, check=False)
+    except OSError:
+        return False
+    return result.returncode == 0
+
 def set_file_permissions(path: str, mode: int):
     """Set file permissions with cross-platform compatibility"""
     if not is_windows():
@@ -88,14 +144,8 @@ def set_file_permissions(path: str, mode: int):
             # Remove all permissions first, then add owner read/write
             os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
 
-            # Additional security: try to set Windows ACL for SSH key files
-            try:
-                import subprocess
-                # Use icacls to set restrictive permissions (owner only)
-                subprocess.run(['icacls', path, '/inheritance:r', '/grant:r', f'{os.getlogin()}:F'],
-                             capture_output=True, check=False)
-            except:
-                pass  # Fallback to basic chmod
+            # Additional security: restrict the Windows ACL to the owner (falls back to basic chmod)
+            _restrict_windows_acl(path)
         else:
             # General case: set read/write based on mode
             os.chmod(path, stat.S_IREAD if mode & 0o200 == 0 else stat.S_IWRITE | stat.S_IREAD)
@@ -103,10 +153,16 @@ def set_file_permissions(path: str, mode: int):
         # Log the error but don't fail - file permissions are important but not critical
         _track_ssh_operation("file_permissions", "windows", False, error=str(e))
 
+_GUID_RE = re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.IGNORECASE)
+
+def _shorten_guid(match) -> str:
+    return f"{match.group(0)[:8]}..."
+
 def safe_error_message(message: str) -> str:
-    import re
-    guid_pattern = r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b'
-    return re.sub(guid_pattern, lambda m: f"{m.group(0)[:8]}...", message, flags=re.IGNORECASE)
+    # A GUID has four dashes; most messages have fewer, so skip the regex scan for them
+    if message.count('-') < 4:
+        return message
+    return _GUID_RE.sub(_shorten_guid, message)
 
 # These folder names are constants that must match the values in bridge/cli/scripts/internal.sh
 INTERIM_FOLDER_NAME = 'interim'
@@ -114,6 +170,13 @@ MOUNTS_FOLDER_NAME = 'mounts'
 REPOSITORIES_FOLDER_NAME = 'repositories'
 IMMOVABLE_FOLDER_NAME = 'immovable'
 
+# Path segments joined onto the datastore in get_repository_paths
+_INTERIM_SEGMENT = f"/{INTERIM_FOLDER_NAME}/"
+_MOUNTS_SEGMENT = f"/{MOUNTS_FOLDER_NAME}/"
+_REPOSITORIES_SEGMENT = f"/{REPOSITORIES_FOLDER_NAME}/"
+_IMMOVABLE_SEGMENT = f"/{IMMOVABLE_FOLDER_NAME}/"
+_RUNTIME_ROOT = "/var/run/rediacc/"
+
 COLORS = {
     'HEADER': '\033[95m', 
     'BLUE': '\033[94m', 
@@ -124,8 +187,59 @@ COLORS = {
     'BOLD': '\033[1m',
 }
 
+# Resolved once; stdout is never swapped out after import. sys.stdout is None under pythonw.
+_IS_TTY = bool(sys.stdout and sys.stdout.isatty())
+_ENDC = COLORS['ENDC']
+
 def colorize(text: str, color: str) -> str:
-    return f"{COLORS.get(color, '')}{text}{COLORS['ENDC']}" if sys.stdout.isatty() else text
+    return f"{COLORS.get(color, '')}{text}{_ENDC}" if _IS_TTY else text
+
+def print_lines(lines):
+    """Print several lines with a single write and flush (a no-op without stdout, like print)"""
+    print("\n".join(lines), flush=True)
+
+def _banner_template(*lines: Tuple[str, str]) -> Tuple[str, str]:
+    """Pre-render a multi-line (text, color) banner as (plain, colored) format strings"""
+    return ("\n".join(text for text, _ in lines),
+            "\n".join(f"{COLORS[color]}{text}{COLORS['ENDC']}" for text, color in lines))
+
+def _format_banner(template: Tuple[str, str], **fields) -> str:
+    return template[_IS_TTY].format(**fields)
+
+_MISSING_IP_BANNER = _banner_template(
+    ("\n✗ Machine configuration error", 'RED'),
+    ("  Machine '{machine_name}' does not have an IP address configured", 'RED'),
+    ("\nThe machine vault must contain:", 'YELLOW'),
+    ("  • 'ip' or 'IP': The machine's IP address", 'YELLOW'),
+    ("  • 'user' or 'USER': SSH username", 'YELLOW'),
+    ("  • 'datastore' or 'DATASTORE': Datastore path (optional)", 'YELLOW'),
+    ("\nPlease update the machine configuration in the Rediacc console.", 'YELLOW'),
+)
+
+_UNREACHABLE_MACHINE_BANNER = _banner_template(
+    ("\n✗ Machine '{machine_name}' is not accessible", 'RED'),
+    ("  Error: {error}", 'RED'),
+    ("\nPossible reasons:", 'YELLOW'),
+    ("  • The machine is offline or powered down", 'YELLOW'),
+    ("  • Network connectivity issues between client and machine", 'YELLOW'),
+    ("  • Firewall blocking SSH port ({port})", 'YELLOW'),
+    ("  • Incorrect IP address in machine configuration", 'YELLOW'),
+    ("\nMachine IP: {ip}", 'BLUE'),
+    ("Port: {port}", 'BLUE'),
+    ("Team: {team_name}", 'BLUE'),
+)
+
+_REPOSITORY_LINE = _banner_template(("Repository: {repository_name}", 'BLUE'))
+# No fields, so the TTY-appropriate rendering is a constant
+_VERIFY_MACHINE_HINT = _format_banner(_banner_template(
+    ("\nPlease verify the machine is online and accessible from your network.", 'YELLOW')))
+_MACHINE_ACCESSIBLE_LINE = _format_banner(_banner_template(("✓ Machine is accessible", 'GREEN')))
+
+_MISSING_SSH_KEY_BANNER = _banner_template(
+    ("{error}", 'RED'),
+    ("The team vault should contain 'SSH_PRIVATE_KEY' field with the SSH private key.", 'YELLOW'),
+    ("Please ensure SSH keys are properly configured in your team's vault settings.", 'YELLOW'),
+)
 
 def error_exit(message: str, code: int = 1):
     """Print an error message in red and exit with the specified code.
@@ -137,19 +251,27 @@ def error_exit(message: str, code: int = 1):
     print(colorize(f"Error: {message}", 'RED'))
     sys.exit(code)
 
+def _clean_subprocess_env() -> Optional[Dict[str, str]]:
+    """Environment without token variables, to avoid stale token propagation.
+
+    Returns None (inherit unchanged) when there is nothing to strip, which is the usual case.
+    """
+    if not any(k.startswith('REDIACC_TOKEN') for k in os.environ):
+        return None
+    return {k: v for k, v in os.environ.items() if not k.startswith('REDIACC_TOKEN')}
+
 def run_command(cmd, capture_output=True, check=True, quiet=False):
     cmd = cmd.split() if isinstance(cmd, str) else cmd
     
     def handle_error(stderr=None):
         if not quiet:
-            error_msg = f"running command: {' '.join([safe_error_message(arg) for arg in cmd])}"
+            error_msg = f"running command: {safe_error_message(' '.join(cmd))}"
             if stderr: 
                 error_msg += f"\n{safe_error_message(stderr)}"
             error_exit(error_msg)
     
     try:
-        # Create clean environment without token variables to avoid stale token propagation
-        clean_env = {k: v for k, v in os.environ.items() if not k.startswith('REDIACC_TOKEN')}
+        clean_env = _clean_subprocess_env()
         if not capture_output: return subprocess.run(cmd, check=False, env=clean_env)
         result = subprocess.run(cmd, capture_output=True, text=True, check=False, env=clean_env)
         if result.returncode != 0 and check:
@@ -165,7 +287,6 @@ def run_command(cmd, capture_output=True, check=True, quiet=False):
         return None
 
 def _retry_with_backoff(func, max_retries=3, initial_delay=0.5, error_msg="Operation failed", exit_on_failure=True):
-    import time
     delay = initial_delay
     
     for attempt in range(max_retries):
@@ -190,38 +311,78 @@ def _create_api_client():
     client.ensure_config_manager()
     return client
 
+# Vault lookups are memoized briefly, keyed by the logged-in identity (email, organization,
+# endpoint). Tokens rotate on every request, so the token itself can't be part of the key.
+_VAULT_CACHE_TTL = 30
+_UNIVERSAL_USER_INFO_CACHE: Dict[Tuple[Any, ...], Tuple[float, Tuple[Optional[str], Optional[str], Optional[str]]]] = {}
+_SSH_KEY_CACHE: Dict[Tuple[Any, ...], Tuple[float, str]] = {}
+
+def _identity_cache_key(*extra) -> Optional[Tuple[Any, ...]]:
+    """Cache key for the logged-in identity, or None when not authenticated"""
+    auth_info = TokenManager.get_auth_info()
+    if not auth_info.get('token'):
+        return None
+    return (auth_info.get('email'), auth_info.get('organization'), auth_info.get('endpoint')) + extra
+
+def _cache_get(cache: Dict[Tuple[Any, ...], Tuple[float, Any]], key: Optional[Tuple[Any, ...]]) -> Any:
+    entry = cache.get(key) if key is not None else None
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+def _cache_put(cache: Dict[Tuple[Any, ...], Tuple[float, Any]], key: Optional[Tuple[Any, ...]], value: Any):
+    if key is not None:
+        cache[key] = (time.monotonic() + _VAULT_CACHE_TTL, value)
+
+def clear_vault_caches():
+    """Drop memoized vault lookups so the next one hits the API (call on logout).
+    Pooled SSH setups are torn down too, so no agent or key file outlives the session.
+    """
+    _UNIVERSAL_USER_INFO_CACHE.clear()
+    _SSH_KEY_CACHE.clear()
+    _CONNECTION_INFO_CACHE.clear()
+    _SSH_POOL.close_all()
+
 def _get_universal_user_info() -> Tuple[Optional[str], Optional[str], Optional[str]]:
-    """Get universal user info and organization ID from API (always fresh) or environment fallback.
+    """Get universal user info and organization ID from API or environment fallback.
     Returns: (universal_user_name, universal_user_id, organization_id)
 
-    Note: This function ALWAYS fetches fresh data from the API to avoid stale cache issues.
-    Organization ID is never cached to disk as it can change and must always be current.
+    Complete API results are memoized in memory for _VAULT_CACHE_TTL seconds,
+    keyed by the logged-in identity (email, organization, endpoint), so logging in
+    as someone else fetches fresh data. Nothing is cached to disk, and incomplete
+    or unauthenticated results are never cached. When the environment explicitly
+    provides all three values, the API is not consulted at all.
     """
-    from .config import get_logger
-    logger = get_logger(__name__)
+    env_info = EnvironmentConfig.get_explicit_universal_user_info()
+    if env_info:
+        return env_info
+
+    cache_key = _identity_cache_key()
+    cached = _cache_get(_UNIVERSAL_USER_INFO_CACHE, cache_key)
+    if cached is not None:
+        return cached
+
+    # The cache key doubles as the login check, so the config is read once per lookup
+    result, from_api = _fetch_universal_user_info(authenticated=cache_key is not None)
+    if from_api and all(result):
+        _cache_put(_UNIVERSAL_USER_INFO_CACHE, cache_key, result)
+    return result
 
+def _fetch_universal_user_info(authenticated: bool) -> Tuple[Tuple[Optional[str], Optional[str], Optional[str]], bool]:
+    """Fetch universal user info from the API, falling back to the environment.
+    Returns ((universal_user_name, universal_user_id, organization_id), complete_from_api)
+    """
     universal_user_name = None
     universal_user_id = None
     organization_id = None
 
     # Always fetch fresh from API if authenticated
-    if TokenManager.get_token():
-        logger.debug(f"[_get_universal_user_info] Fetching fresh data from GetOrganizationVault API...")
+    if authenticated:
+        logger.debug("[_get_universal_user_info] Fetching fresh data from GetOrganizationVault API...")
         try:
             client = _create_api_client()
-            current_token = TokenManager.get_token()
+            # Token rotation is persisted by the client through TokenManager.set_token
             response = client.token_request("GetOrganizationVault", {})
-            new_token = TokenManager.get_token()
-
-            # Save updated token if it changed
-            if new_token != current_token:
-                config_path = get_main_config_file()
-                if config_path.exists():
-                    config = json.load(open(config_path, 'r'))
-                    config['token'] = new_token
-                    with open(config_path, 'w') as f:
-                        json.dump(config, f, indent=2)
-                    logger.debug(f"[_get_universal_user_info] Token rotated and saved")
 
             if not response.get('error'):
                 for table in response.get('resultSets', []):
@@ -231,34 +392,35 @@ def _get_universal_user_info() -> Tuple[Optional[str], Optional[str], Optional[s
                             # Get organization_id from organizationCredential field
                             if 'organizationCredential' in row or 'OrganizationCredential' in row:
                                 organization_id = row.get('organizationCredential') or row.get('OrganizationCredential')
-                                logger.debug(f"[_get_universal_user_info] From API (organizationCredential): {organization_id}")
+                                logger.debug("[_get_universal_user_info] From API (organizationCredential): %s", organization_id)
 
                             # Get user info from vault content
                             vault_content = row.get('vaultContent')
                             if vault_content:
                                 try:
-                                    vault_data = json.loads(vault_content)
+                                    vault_data = _load_vault(vault_content)
                                     if not universal_user_name:
                                         universal_user_name = vault_data.get('UNIVERSAL_USER_NAME')
                                     if not universal_user_id:
                                         universal_user_id = vault_data.get('UNIVERSAL_USER_ID')
-                                    logger.debug(f"[_get_universal_user_info] From API vault content:")
-                                    logger.debug(f"  - UNIVERSAL_USER_NAME: {universal_user_name}")
-                                    logger.debug(f"  - UNIVERSAL_USER_ID: {universal_user_id}")
+                                    logger.debug("[_get_universal_user_info] From API vault content:")
+                                    logger.debug("  - UNIVERSAL_USER_NAME: %s", universal_user_name)
+                                    logger.debug("  - UNIVERSAL_USER_ID: %s", universal_user_id)
                                 except json.JSONDecodeError as e:
-                                    logger.debug(f"[_get_universal_user_info] Failed to parse vault content: {e}")
+                                    logger.debug("[_get_universal_user_info] Failed to parse vault content: %s", e)
 
                             if organization_id:
                                 break
             else:
-                logger.debug(f"[_get_universal_user_info] API error: {response.get('error')}")
+                logger.debug("[_get_universal_user_info] API error: %s", response.get('error'))
         except Exception as e:
-            logger.debug(f"[_get_universal_user_info] API fetch failed: {e}")
+            logger.debug("[_get_universal_user_info] API fetch failed: %s", e)
+
+    from_api = bool(universal_user_name and universal_user_id and organization_id)
 
     # Fallback to environment if API didn't provide values
-    if not universal_user_name or not universal_user_id or not organization_id:
-        logger.debug(f"[_get_universal_user_info] Missing values from API, checking environment...")
-        from .env_config import EnvironmentConfig
+    if not from_api:
+        logger.debug("[_get_universal_user_info] Missing values from API, checking environment...")
         env_user_name, env_user_id, env_organization_id = EnvironmentConfig.get_universal_user_info()
 
         # Use environment values as fallback
@@ -269,31 +431,26 @@ def _get_universal_user_info() -> Tuple[Optional[str], Optional[str], Optional[s
         if not organization_id:
             organization_id = env_organization_id
 
-        logger.debug(f"[_get_universal_user_info] Environment fallback values:")
-        logger.debug(f"  - universal_user_name: {env_user_name}")
-        logger.debug(f"  - universal_user_id: {env_user_id}")
-        logger.debug(f"  - organization_id: {env_organization_id}")
+        logger.debug("[_get_universal_user_info] Environment fallback values:")
+        logger.debug("  - universal_user_name: %s", env_user_name)
+        logger.debug("  - universal_user_id: %s", env_user_id)
+        logger.debug("  - organization_id: %s", env_organization_id)
 
-    logger.debug(f"[_get_universal_user_info] Final result (always fresh):")
-    logger.debug(f"  - universal_user_name: {universal_user_name}")
-    logger.debug(f"  - universal_user_id: {universal_user_id}")
-    logger.debug(f"  - organization_id: {organization_id}")
-    logger.debug(f"  - Source: API (fresh data)")
+    logger.debug("[_get_universal_user_info] Final result:")
+    logger.debug("  - universal_user_name: %s", universal_user_name)
+    logger.debug("  - universal_user_id: %s", universal_user_id)
+    logger.debug("  - organization_id: %s", organization_id)
+    logger.debug("  - Source: %s", 'API' if from_api else 'environment fallback')
 
-    return (universal_user_name, universal_user_id, organization_id)
+    return (universal_user_name, universal_user_id, organization_id), from_api
 
-class _SuppressSysExit:
-    def __init__(self): self.exit_called = False; self.original_exit = None
-    def __enter__(self):
-        self.original_exit = sys.exit
-        sys.exit = lambda code=0: setattr(self, 'exit_called', True)
-        return self
-    def __exit__(self, exc_type, exc_val, exc_tb): sys.exit = self.original_exit
+def _load_vault(vault_content) -> Dict[str, Any]:
+    """Decode a vaultContent field, which may be a JSON string or an already decoded dict"""
+    return _json_loads(vault_content) if isinstance(vault_content, str) else vault_content
 
 def get_machine_info_with_team(team_name: str, machine_name: str) -> Dict[str, Any]:
     """Get machine info using the API client directly"""
     from .api_client import client
-    from .config import TokenManager
     
     if not TokenManager.get_token(): 
         error_exit("No authentication token available")
@@ -304,16 +461,11 @@ def get_machine_info_with_team(team_name: str, machine_name: str) -> Dict[str, A
     if response.get('error'):
         error_exit(f"Failed to get machines for team {team_name}: {response['error']}")
     
-    # Find the specific machine in the response
-    machines = []
-    for result_set in response.get('resultSets', []):
-        machines.extend(result_set.get('data', []))
-    
-    machine_info = None
-    for machine in machines:
-        if machine.get('machineName') == machine_name:
-            machine_info = machine
-            break
+    # Find the specific machine in the response, stopping at the first match
+    machine_info = next((machine
+                         for result_set in response.get('resultSets', [])
+                         for machine in result_set.get('data', [])
+                         if machine.get('machineName') == machine_name), None)
     
     if not machine_info:
         error_exit(f"No machine data found for '{machine_name}' in team '{team_name}'")
@@ -321,66 +473,64 @@ def get_machine_info_with_team(team_name: str, machine_name: str) -> Dict[str, A
     # Parse vault content if available
     vault_content = machine_info.get('vaultContent')
     if vault_content:
-        try: 
-            machine_info['vault'] = json.loads(vault_content) if isinstance(vault_content, str) else vault_content
-        except json.JSONDecodeError: 
+        try:
+            machine_info['vault'] = _load_vault(vault_content)
+            # Lets get_machine_connection_info reuse the dict instead of parsing again
+            machine_info['_vault_parsed_for'] = vault_content
+        except json.JSONDecodeError:
             pass
     
     return machine_info
 
 
 def get_repository_info(team_name: str, repository_name: str) -> Dict[str, Any]:
-    from .config import get_logger
-    logger = get_logger(__name__)
+    """Get repository info using the API client directly"""
+    from .api_client import client
 
     if not TokenManager.get_token():
         error_exit("No authentication token available")
 
-    def try_inspect(quiet: bool = False):
-        with _SuppressSysExit() as ctx:
-            cmd = get_cli_command() + ['--output', 'json', 'inspect', 'repository', team_name, repository_name]
-            output = run_command(cmd, quiet=quiet)
-            return output, ctx.exit_called
+    # Same endpoint and filter as `rediacc inspect repository`, without spawning the CLI
+    response = client.token_request("GetTeamRepositories", {"teamName": team_name})
 
-    # Single attempt only, no retry
-    inspect_output, exit_called = try_inspect(quiet=False)
-    if not inspect_output or exit_called:
-        error_exit(f"Failed to inspect repository {repository_name}")
+    if response.get('error'):
+        error_exit(f"inspecting repository: {response['error']}")
 
-    try:
-        inspect_data = json.loads(inspect_output)
-        if not inspect_data.get('success'):
-            error_exit(f"inspecting repository: {inspect_data.get('error', 'Unknown error')}")
-
-        data_list = inspect_data.get('data', [])
-        if not data_list:
-            error_exit(f"No repository data found for '{repository_name}' in team '{team_name}'")
-        repository_info = data_list[0]
-
-        # DEBUG: Log the repository info to track GUID fields
-        logger.debug(f"[get_repository_info] Repository '{repository_name}' API response:")
-        logger.debug(f"  - repositoryGuid: {repository_info.get('repositoryGuid')}")
-        logger.debug(f"  - grandGuid: {repository_info.get('grandGuid')}")
-        logger.debug(f"  - All keys in response: {list(repository_info.keys())}")
-
-        vault_content = repository_info.get('vaultContent')
-        if vault_content:
-            try: repository_info['vault'] = json.loads(vault_content) if isinstance(vault_content, str) else vault_content
-            except json.JSONDecodeError: pass
-
-        return repository_info
-    except json.JSONDecodeError as e:
-        error_exit(f"Failed to parse JSON response: {e}")
+    # Repository rows are in table index 1 (index 0 holds credentials)
+    result_sets = response.get('resultSets', [])
+    repositories = result_sets[1].get('data', []) if len(result_sets) > 1 else []
+    repository_info = next((repository for repository in repositories
+                            if repository.get('repositoryName') == repository_name), None)
+    if not repository_info:
+        error_exit(f"No repository data found for '{repository_name}' in team '{team_name}'")
+
+    # DEBUG: Log the repository info to track GUID fields
+    logger.debug("[get_repository_info] Repository '%s' API response:", repository_name)
+    logger.debug("  - repositoryGuid: %s", repository_info.get('repositoryGuid'))
+    logger.debug("  - grandGuid: %s", repository_info.get('grandGuid'))
+    logger.debug("  - All keys in response: %s", list(repository_info.keys()))
+
+    vault_content = repository_info.get('vaultContent')
+    if vault_content:
+        try: repository_info['vault'] = _load_vault(vault_content)
+        except json.JSONDecodeError: pass
+
+    return repository_info
 
 def get_ssh_key_from_vault(team_name: Optional[str] = None) -> Optional[str]:
-    """Get SSH key from team vault using the API client directly"""
+    """Get SSH key from team vault using the API client directly.
+    Found keys are memoized for _VAULT_CACHE_TTL seconds per identity and team.
+    """
     from .api_client import client
-    from .config import TokenManager
     
-    token = TokenManager.get_token()
-    if not token:
+    cache_key = _identity_cache_key(team_name)
+    if cache_key is None:
         print(colorize("No authentication token available", 'RED'))
         return None
+
+    cached = _cache_get(_SSH_KEY_CACHE, cache_key)
+    if cached is not None:
+        return cached
     
     # Use API client directly to get teams
     response = client.token_request("GetOrganizationTeams", {})
@@ -403,15 +553,18 @@ def get_ssh_key_from_vault(team_name: Optional[str] = None) -> Optional[str]:
             continue
         
         try:
-            vault_data = json.loads(vault_content) if isinstance(vault_content, str) else vault_content
+            vault_data = _load_vault(vault_content)
             ssh_key = vault_data.get('SSH_PRIVATE_KEY')
             if ssh_key:
+                _cache_put(_SSH_KEY_CACHE, cache_key, ssh_key)
                 return ssh_key
         except json.JSONDecodeError:
             continue
     
     return None
 
+_CR_LINE_END_RE = re.compile(r'\r\n?')
+
 def _decode_ssh_key(ssh_key: str) -> str:
     """Decode and normalize SSH key (plain text PEM)"""
 
@@ -422,18 +575,18 @@ def _decode_ssh_key(ssh_key: str) -> str:
         raise ValueError("SSH key must be in PEM format (should start with -----BEGIN)")
 
     # Normalize line endings to Unix format (required for SSH compatibility)
-    ssh_key = ssh_key.replace('\r\n', '\n').replace('\r', '\n')
+    if '\r' in ssh_key:
+        ssh_key = _CR_LINE_END_RE.sub('\n', ssh_key)
 
     # Ensure key ends with single newline
     ssh_key = ssh_key.rstrip('\n') + '\n'
 
-    # Basic validation - check for SSH key markers
-    if not ('-----BEGIN' in ssh_key and '-----END' in ssh_key):
+    # Basic validation - check for SSH key markers (-----BEGIN is checked above)
+    if '-----END' not in ssh_key:
         raise ValueError("SSH key does not contain valid PEM markers")
 
-    # Validate common SSH key types
-    valid_key_types = ['RSA PRIVATE KEY', 'DSA PRIVATE KEY', 'EC PRIVATE KEY', 'PRIVATE KEY', 'OPENSSH PRIVATE KEY']
-    if not any(key_type in ssh_key for key_type in valid_key_types):
+    # Validate common SSH key types; RSA, DSA, EC and OpenSSH headers all end in "PRIVATE KEY"
+    if 'PRIVATE KEY' not in ssh_key:
         raise ValueError("SSH key type not recognized. Supported types: RSA, DSA, EC, OpenSSH")
 
     return ssh_key
@@ -445,44 +598,108 @@ def _decode_known_hosts(known_hosts: str) -> str:
         return known_hosts
 
     # Normalize line endings to Unix format
-    known_hosts = known_hosts.replace('\r\n', '\n').replace('\r', '\n')
+    if '\r' in known_hosts:
+        known_hosts = _CR_LINE_END_RE.sub('\n', known_hosts)
 
     # Remove trailing newlines (we'll add one when writing to file)
     known_hosts = known_hosts.rstrip('\n')
 
     return known_hosts
 
+@functools.lru_cache(maxsize=1)
+def _which_ssh() -> Optional[str]:
+    import shutil
+    return shutil.which('ssh')
+
+@functools.lru_cache(maxsize=None)
+def _is_msys2_ssh(ssh_executable: Optional[str] = None) -> bool:
+    """Whether the given SSH executable (or the one on PATH) is an MSYS2/MinGW build"""
+    ssh_path = (ssh_executable or _which_ssh() or '').lower()
+    return 'msys' in ssh_path or 'mingw' in ssh_path
+
 def _convert_path_for_ssh(path: str, ssh_executable: str = None) -> str:
     """Convert Windows paths for SSH compatibility based on SSH implementation"""
     if not path or not is_windows():
         return path
 
-    # Determine if we're using MSYS2 SSH or Windows OpenSSH
-    using_msys2 = False
-    if ssh_executable:
-        # Check if the SSH executable is from MSYS2
-        using_msys2 = 'msys' in ssh_executable.lower() or 'mingw' in ssh_executable.lower()
-    else:
-        # Try to detect which SSH is in use by checking PATH
-        import shutil
-        ssh_path = shutil.which('ssh')
-        if ssh_path:
-            using_msys2 = 'msys' in ssh_path.lower() or 'mingw' in ssh_path.lower()
-
-    if using_msys2:
-        # Convert Windows path to MSYS2 format for MSYS2 SSH
-        path = path.replace('\\', '/')
-        if ':' in path and len(path) > 2:
-            # Convert C:/path to /c/path format
-            drive = path[0].lower()
-            rest = path[2:] if path[1] == ':' else path
-            path = f'/{drive}{rest}'
-    else:
-        # For Windows OpenSSH, just normalize backslashes to forward slashes
-        path = path.replace('\\', '/')
-
+    # Both MSYS2 SSH and Windows OpenSSH accept forward slashes
+    path = path.replace('\\', '/')
+    if _is_msys2_ssh(ssh_executable) and len(path) > 2 and path[1] == ':':
+        # Convert C:/path to /c/path format for MSYS2 SSH
+        path = f'/{path[0].lower()}{path[2:]}'
     return path
 
+# OpenSSH connection multiplexing: the first ssh/scp/rsync call of a connection opens a
+# ControlMaster socket and every later call reuses it instead of redoing TCP+KEX+auth.
+# Masters are closed on cleanup; ControlPersist only bounds masters that outlive it.
+SSH_CONTROL_PERSIST = '10m'
+SSH_CONTROL_PERSIST_SECONDS = 600
+_SUN_PATH_MAX = 104  # sun_path limit on macOS/BSD (108 on Linux)
+
+@functools.lru_cache(maxsize=1)
+def _ssh_sockets_dir() -> Optional[str]:
+    """Create the ControlMaster socket directory and sweep stale sockets on first use.
+
+    Returns None when multiplexing is unavailable: Windows OpenSSH has no ControlMaster
+    support, and the socket path must fit sun_path and survive whitespace splitting.
+    """
+    if is_windows():
+        return None
+    try:
+        sockets_dir = str(get_ssh_sockets_dir())
+    except OSError:
+        return None
+    # ControlPath is cm-<tag>-<%C>, where %C expands to 40 hex characters
+    if ' ' in sockets_dir or len(sockets_dir) + len('/cm-00000000-') + 40 >= _SUN_PATH_MAX:
+        return None
+
+    import socket
+    cutoff = time.time() - SSH_CONTROL_PERSIST_SECONDS
+    try:
+        with os.scandir(sockets_dir) as entries:
+            for entry in entries:
+                try:
+                    if not entry.name.startswith('cm-') or entry.stat(follow_symlinks=False).st_mtime > cutoff:
+                        continue
+                    # Only remove sockets no master is listening on anymore
+                    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                        if probe.connect_ex(entry.path) == 0:
+                            continue
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return sockets_dir
+
+def _ssh_control_tag(known_hosts_path: str) -> str:
+    """Per-connection ControlPath tag, derived from the connection's known_hosts temp file"""
+    import hashlib
+    return hashlib.sha256(known_hosts_path.encode()).hexdigest()[:8]
+
+def _ssh_multiplex_options(known_hosts_path: str) -> str:
+    sockets_dir = _ssh_sockets_dir() if known_hosts_path else None
+    if not sockets_dir:
+        return ''
+    control_path = f"{sockets_dir}/cm-{_ssh_control_tag(known_hosts_path)}-%C"
+    return f"-o ControlMaster=auto -o ControlPath={control_path} -o ControlPersist={SSH_CONTROL_PERSIST}"
+
+def close_ssh_masters(known_hosts_file: str):
+    """Ask the ControlMaster processes opened for a connection to exit."""
+    sockets_dir = _ssh_sockets_dir() if known_hosts_file else None
+    if not sockets_dir:
+        return
+    prefix = f"cm-{_ssh_control_tag(known_hosts_file)}-"
+    try:
+        names = [name for name in os.listdir(sockets_dir) if name.startswith(prefix)]
+    except OSError:
+        return
+    for name in names:
+        # A literal ControlPath identifies the master, so the destination is irrelevant
+        control_path = os.path.join(sockets_dir, name)
+        try: subprocess.run(['ssh', '-O', 'exit', '-o', f'ControlPath={control_path}', 'dummy'], capture_output=True, timeout=5)
+        except Exception: pass
+
 def _setup_ssh_options(known_hosts: str, known_hosts_path: str, key_path: str = None, ssh_executable: str = None, port: int = 22) -> str:
     """Setup SSH options with strict host key verification
 
@@ -504,6 +721,8 @@ def _setup_ssh_options(known_hosts: str, known_hosts_path: str, key_path: str =
             "Contact your administrator to add the host key to the machine vault."
         )
 
+    multiplex_opts = _ssh_multiplex_options(known_hosts_path)
+
     # Convert paths based on SSH implementation (MSYS2 vs Windows OpenSSH)
     if known_hosts_path:
         known_hosts_path = _convert_path_for_ssh(known_hosts_path, ssh_executable)
@@ -512,16 +731,33 @@ def _setup_ssh_options(known_hosts: str, known_hosts_path: str, key_path: str =
 
     # STRICT host key checking - we trust ONLY what the service provides
     base_opts = f"-o StrictHostKeyChecking=yes -o UserKnownHostsFile={known_hosts_path} -p {port}"
-    _track_ssh_operation("host_key_verification", "known_host", True)
+    if _TELEMETRY_ENABLED:
+        _track_ssh_operation("host_key_verification", "known_host", True)
 
     # Add additional security options
     security_opts = "-o PasswordAuthentication=no -o PubkeyAuthentication=yes -o PreferredAuthentications=publickey"
 
     # Combine all options
     all_opts = f"{base_opts} {security_opts}"
+    if multiplex_opts:
+        all_opts = f"{all_opts} {multiplex_opts}"
 
     return f"{all_opts} -i {key_path}" if key_path else all_opts
 
+def _kill_ssh_agent(agent_pid: str):
+    """Terminate an ssh-agent started by setup_ssh_agent_connection"""
+    if is_windows():
+        # ssh-agent reports an MSYS/Cygwin PID there, which only the bundled `kill` understands
+        try: subprocess.run(['kill', agent_pid], capture_output=True, timeout=5)
+        except: pass
+        return
+    import signal
+    try: os.kill(int(agent_pid), signal.SIGTERM)
+    except (OSError, ValueError): pass
+
+# Matches `NAME=value;` assignments in `ssh-agent -s` output
+_AGENT_LINE_RE = re.compile(r'^([A-Z_][A-Z0-9_]*)=([^;]*);')
+
 def setup_ssh_agent_connection(ssh_key: str, known_hosts: str, port: int = 22) -> Tuple[str, str, str]:
     """Setup SSH connection using ssh-agent with strict host key verification
 
@@ -533,8 +769,6 @@ def setup_ssh_agent_connection(ssh_key: str, known_hosts: str, port: int = 22) -
     Raises:
         ValueError: If known_hosts is None or empty
     """
-    import subprocess
-
     ssh_key = _decode_ssh_key(ssh_key)
     
     try:
@@ -543,21 +777,23 @@ def setup_ssh_agent_connection(ssh_key: str, known_hosts: str, port: int = 22) -
             raise RuntimeError(f"Failed to start ssh-agent: {agent_result.stderr}")
         
         agent_env = {}
-        for line in agent_result.stdout.strip().split('\n'):
-            var_assignment = line.split(';')[0] if ';' in line else line
-            if '=' in line and ';' in line and '=' in var_assignment:
-                key, value = var_assignment.split('=', 1)
-                agent_env[key] = os.environ[key] = value
+        for line in agent_result.stdout.splitlines():
+            m = _AGENT_LINE_RE.match(line)
+            if m:
+                agent_env[m.group(1)] = os.environ[m.group(1)] = m.group(2)
         
         agent_pid = agent_env.get('SSH_AGENT_PID')
+        agent_sock = agent_env.get('SSH_AUTH_SOCK')
         if not agent_pid: raise RuntimeError("Could not get SSH agent PID")
+        if not agent_sock: raise RuntimeError("Could not get SSH agent socket")
         
         ssh_add_result = subprocess.run(['ssh-add', '-'], 
                                       input=ssh_key, text=True,
-                                      capture_output=True, timeout=10)
+                                      capture_output=True, timeout=10,
+                                      env={**os.environ, **agent_env})
         
         if ssh_add_result.returncode != 0:
-            subprocess.run(['kill', agent_pid], capture_output=True)
+            _kill_ssh_agent(agent_pid)
             raise RuntimeError(f"Failed to add SSH key to agent: {ssh_add_result.stderr}")
         
     except Exception as e:
@@ -565,17 +801,125 @@ def setup_ssh_agent_connection(ssh_key: str, known_hosts: str, port: int = 22) -
     
     # Always create a known_hosts file, even for first-time connections
     # This allows SSH to save the host key for future verification
-    known_hosts_file_path = create_temp_file(suffix='_known_hosts', prefix='known_hosts_')
+    try:
+        known_hosts, known_hosts_file_path = _acquire_known_hosts_file(known_hosts, ssh_key)
+    except Exception:
+        _kill_ssh_agent(agent_pid)
+        raise
+
+    try:
+        ssh_opts = _setup_ssh_options(known_hosts, known_hosts_file_path, port=port)
+    except Exception:
+        cleanup_ssh_agent(agent_pid, known_hosts_file_path)
+        raise
+
+    # Pin this agent: SSH_AUTH_SOCK is process-global and later agent setups overwrite it
+    ssh_opts = f"{ssh_opts} -o IdentityAgent={agent_sock}"
+
+    return ssh_opts, agent_pid, known_hosts_file_path
+
+_SSH_TEMP_DIR = None
+_SSH_TEMP_DIR_INHERITS_ACL = False
+# Content-addressed SSH key and known_hosts files -> number of connections using them
+_SHARED_SSH_FILES: Dict[str, int] = {}
+_SHARED_SSH_FILES_LOCK = threading.Lock()
+
+def _get_ssh_temp_dir() -> str:
+    """Private per-process directory for SSH key and known_hosts files (caller holds _SHARED_SSH_FILES_LOCK)"""
+    global _SSH_TEMP_DIR, _SSH_TEMP_DIR_INHERITS_ACL
+    if _SSH_TEMP_DIR is None or not os.path.isdir(_SSH_TEMP_DIR):
+        base_dir = None
+        if is_windows():
+            base_dir = get('REDIACC_TEMP_DIR') or os.environ.get('TEMP') or os.environ.get('TMP')
+            if not base_dir:
+                raise ValueError("No temporary directory found. Set REDIACC_TEMP_DIR, TEMP, or TMP environment variable.")
+        _SSH_TEMP_DIR = tempfile.mkdtemp(prefix='rediacc_ssh_', dir=base_dir)
+        # One icacls call for the directory; key files created in it inherit the owner-only ACL
+        _SSH_TEMP_DIR_INHERITS_ACL = is_windows() and _restrict_windows_acl(_SSH_TEMP_DIR, inherit=True)
+    return _SSH_TEMP_DIR
+
+def _remove_ssh_temp_dir():
+    # Only removed when empty: files still referenced (e.g. by detached tunnels) are kept
+    if _SSH_TEMP_DIR:
+        with contextlib.suppress(OSError):
+            os.rmdir(_SSH_TEMP_DIR)
+
+atexit.register(_remove_ssh_temp_dir)
+
+def _write_private_file(path: str, content: str):
+    """Create path as a 0600 file holding content; an existing file is left as is"""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return
+    try:
+        # Write with Unix line endings for cross-platform compatibility
+        # Use newline='\n' to force Unix line endings on Windows
+        with open(fd, 'w', newline='\n', encoding='utf-8') as f:
+            f.write(content)
+        if is_windows() and not _SSH_TEMP_DIR_INHERITS_ACL:
+            set_file_permissions(path, 0o600)
+    except Exception:
+        _unlink_if_exists(path)
+        raise
+
+def _acquire_shared_ssh_file(content: str, prefix: str, suffix: str, scope: str = '') -> str:
+    """Get a 0600 file holding content, shared by every connection in this process that asks
+    for the same (scope, content).
+
+    The file is written (and on Windows, ACL-restricted) only when it doesn't exist yet.
+    Each call must be balanced by _release_ssh_file().
+    """
+    import hashlib
+    name = hashlib.blake2b(f"{scope}\0{content}".encode(), digest_size=8).hexdigest()
+    with _SHARED_SSH_FILES_LOCK:
+        path = os.path.join(_get_ssh_temp_dir(), f"{prefix}{name}{suffix}")
+        if path not in _SHARED_SSH_FILES:
+            _write_private_file(path, content)
+        _SHARED_SSH_FILES[path] = _SHARED_SSH_FILES.get(path, 0) + 1
+        return path
+
+def _acquire_ssh_key_file(ssh_key: str) -> str:
+    return _acquire_shared_ssh_file(ssh_key, 'ssh_key_', '_rsa')
+
+def _acquire_known_hosts_file(known_hosts: Optional[str], ssh_key: str) -> Tuple[Optional[str], str]:
+    """Decode known_hosts and get a shared file holding it; returns (decoded known_hosts, path).
 
+    The file is scoped to the SSH key as well: its path tags the ControlMaster sockets, so
+    only connections authenticating with the same key end up sharing a master.
+    """
     if known_hosts:
         # Decode and write the existing host entry from the vault
         known_hosts = _decode_known_hosts(known_hosts)
-        with open(known_hosts_file_path, 'w') as f: f.write(known_hosts + '\n')
     # If no known_hosts, the file is empty but will be used to store the new host key
+    content = known_hosts + '\n' if known_hosts else ''
+    import hashlib
+    scope = hashlib.blake2b(ssh_key.encode(), digest_size=8).hexdigest()
+    return known_hosts, _acquire_shared_ssh_file(content, 'known_hosts_', '_known_hosts', scope)
 
-    ssh_opts = _setup_ssh_options(known_hosts, known_hosts_file_path, port=port)
+def _release_ssh_file(path: Optional[str], on_last_release=None):
+    """Drop one reference to a shared SSH file, deleting it with the last; other files are deleted directly.
 
-    return ssh_opts, agent_pid, known_hosts_file_path
+    on_last_release(path) runs right before the file is deleted.
+    """
+    if not path:
+        return
+    with _SHARED_SSH_FILES_LOCK:
+        count = _SHARED_SSH_FILES.get(path)
+        if count is not None:
+            if count > 1:
+                _SHARED_SSH_FILES[path] = count - 1
+                return
+            del _SHARED_SSH_FILES[path]
+        if on_last_release:
+            on_last_release(path)
+        _unlink_if_exists(path)
+
+def _unlink_if_exists(path: Optional[str]):
+    """Delete path in one syscall, ignoring files that are already gone"""
+    if path:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
 
 def setup_ssh_for_connection(ssh_key: str, known_hosts: str, ssh_executable: str = None, port: int = 22) -> Tuple[str, str, str]:
     """Setup SSH connection with strict host key verification
@@ -595,73 +939,159 @@ def setup_ssh_for_connection(ssh_key: str, known_hosts: str, ssh_executable: str
         _track_ssh_operation("key_validation", "unknown", False, error=str(e))
         raise RuntimeError(f"SSH key validation failed: {e}")
 
-    ssh_key_file_path = create_temp_file(suffix='_rsa', prefix='ssh_key_')
-
     try:
-        # Write SSH key with Unix line endings for cross-platform compatibility
-        # Use newline='\n' to force Unix line endings on Windows
-        with open(ssh_key_file_path, 'w', newline='\n', encoding='utf-8') as f:
-            f.write(ssh_key)
-
-        set_file_permissions(ssh_key_file_path, 0o600)
-
-        # Verify the file was written correctly
-        if not os.path.exists(ssh_key_file_path):
-            raise RuntimeError("SSH key file was not created successfully")
-
-        # On Windows, verify the file content (for debugging libcrypto issues)
-        if is_windows():
-            try:
-                with open(ssh_key_file_path, 'r', encoding='utf-8') as f:
-                    written_content = f.read()
-                if '-----BEGIN' not in written_content:
-                    raise RuntimeError("SSH key file content validation failed")
-            except Exception as e:
-                _track_ssh_operation("key_file_validation", "windows", False, error=str(e))
-                raise RuntimeError(f"SSH key file validation failed: {e}")
-
+        ssh_key_file_path = _acquire_ssh_key_file(ssh_key)
     except Exception as e:
-        # Clean up the file if creation failed
-        if os.path.exists(ssh_key_file_path):
-            try:
-                os.unlink(ssh_key_file_path)
-            except:
-                pass
         raise RuntimeError(f"Failed to create SSH key file: {e}")
-    
+
+    # On Windows, verify the file content (for debugging libcrypto issues)
+    if is_windows():
+        try:
+            with open(ssh_key_file_path, 'r', encoding='utf-8') as f:
+                written_content = f.read()
+            if '-----BEGIN' not in written_content:
+                raise RuntimeError("SSH key file content validation failed")
+        except Exception as e:
+            _release_ssh_file(ssh_key_file_path)
+            _track_ssh_operation("key_file_validation", "windows", False, error=str(e))
+            raise RuntimeError(f"Failed to create SSH key file: SSH key file validation failed: {e}")
+
     # Always create a known_hosts file, even for first-time connections
     # This allows SSH to save the host key for future verification
-    known_hosts_file_path = create_temp_file(suffix='_known_hosts', prefix='known_hosts_')
-    if known_hosts:
-        # Decode and write the existing host entry from the vault
-        known_hosts = _decode_known_hosts(known_hosts)
-        with open(known_hosts_file_path, 'w') as f:
-            f.write(known_hosts + '\n')
-    # If no known_hosts, the file is empty but will be used to store the new host key
+    try:
+        known_hosts, known_hosts_file_path = _acquire_known_hosts_file(known_hosts, ssh_key)
+    except Exception:
+        _release_ssh_file(ssh_key_file_path)
+        raise
 
-    ssh_opts = _setup_ssh_options(known_hosts, known_hosts_file_path, ssh_key_file_path, ssh_executable, port)
+    try:
+        ssh_opts = _setup_ssh_options(known_hosts, known_hosts_file_path, ssh_key_file_path, ssh_executable, port)
+    except Exception:
+        cleanup_ssh_key(ssh_key_file_path, known_hosts_file_path)
+        raise
 
     return ssh_opts, ssh_key_file_path, known_hosts_file_path
 
+# known_hosts files are shared, and their path tags the ControlMaster sockets, so masters
+# are only closed once the last connection using the file lets go of it
 def cleanup_ssh_agent(agent_pid: str, known_hosts_file: str = None):
-    import subprocess
+    _release_ssh_file(known_hosts_file, close_ssh_masters)
     if agent_pid:
-        try: subprocess.run(['kill', agent_pid], capture_output=True, timeout=5)
-        except: pass
-    if known_hosts_file and os.path.exists(known_hosts_file): os.unlink(known_hosts_file)
+        _kill_ssh_agent(agent_pid)
 
 def cleanup_ssh_key(ssh_key_file: str, known_hosts_file: str = None):
-    for file_path in (ssh_key_file, known_hosts_file):
-        if file_path and os.path.exists(file_path): os.unlink(file_path)
+    _release_ssh_file(known_hosts_file, close_ssh_masters)
+    _release_ssh_file(ssh_key_file)
+
+class _PooledSSHSetup:
+    """SSH resources (agent or key file, known_hosts file, ControlMaster sockets) shared by pool users"""
+
+    def __init__(self, ssh_opts: str, agent_pid: Optional[str], ssh_key_file: Optional[str],
+                 known_hosts_file: Optional[str]):
+        self.ssh_opts = ssh_opts
+        self.agent_pid = agent_pid
+        self.ssh_key_file = ssh_key_file
+        self.known_hosts_file = known_hosts_file
+        self.refcount = 0
+        self.idle_timer: Optional[threading.Timer] = None
+
+    def cleanup(self):
+        if self.agent_pid:
+            cleanup_ssh_agent(self.agent_pid, self.known_hosts_file)
+        elif self.ssh_key_file:
+            cleanup_ssh_key(self.ssh_key_file, self.known_hosts_file)
+
+class SSHConnectionPool:
+    """Process-wide pool of SSH connection setups.
+
+    Entries are keyed by (key fingerprint, host key fingerprint, port, prefer_agent) and
+    refcounted; an entry is torn down after IDLE_TIMEOUT seconds without users, or at exit.
+    Reusing an entry also reuses its ControlMaster sockets, so the 2nd..Nth consumer in a
+    process skips agent startup, key file writes and the SSH handshake.
+    """
+
+    IDLE_TIMEOUT = SSH_CONTROL_PERSIST_SECONDS
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool: Dict[Tuple[str, str, int, bool], _PooledSSHSetup] = {}
+
+    @staticmethod
+    def make_key(ssh_key: str, known_hosts: str, port: int, prefer_agent: bool) -> Tuple[str, str, int, bool]:
+        import hashlib
+        return (hashlib.sha256(ssh_key.encode()).hexdigest()[:16],
+                hashlib.sha256(known_hosts.encode()).hexdigest()[:16], port, prefer_agent)
+
+    def acquire(self, key) -> Optional[_PooledSSHSetup]:
+        """Check out a live entry, or return None on a pool miss."""
+        with self._lock:
+            entry = self._pool.get(key)
+            if entry is None:
+                return None
+            if entry.idle_timer:
+                entry.idle_timer.cancel()
+                entry.idle_timer = None
+            entry.refcount += 1
+        return entry
+
+    def add(self, key, entry: _PooledSSHSetup) -> bool:
+        """Register a freshly set up entry checked out once; False if the key is already pooled."""
+        with self._lock:
+            if key in self._pool:
+                return False
+            entry.refcount = 1
+            self._pool[key] = entry
+            return True
+
+    def release(self, key):
+        with self._lock:
+            entry = self._pool.get(key)
+            if entry is None:
+                return
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+            entry.idle_timer = threading.Timer(self.IDLE_TIMEOUT, self._evict, (key, entry))
+            entry.idle_timer.daemon = True
+            entry.idle_timer.start()
+
+    def _evict(self, key, entry: _PooledSSHSetup):
+        with self._lock:
+            if self._pool.get(key) is not entry or entry.refcount > 0:
+                return
+            del self._pool[key]
+        entry.cleanup()
+
+    def close_all(self):
+        with self._lock:
+            entries = list(self._pool.values())
+            self._pool.clear()
+        for entry in entries:
+            if entry.idle_timer:
+                entry.idle_timer.cancel()
+            try: entry.cleanup()
+            except Exception: pass
+
+_SSH_POOL = SSHConnectionPool()
+atexit.register(_SSH_POOL.close_all)
+
+def get_ssh_connection_pool() -> SSHConnectionPool:
+    return _SSH_POOL
 
 class SSHConnection:
     """Context manager for SSH connections with strict security and automatic cleanup.
 
     Requires host key from service for all connections - no insecure connections allowed.
     Tries SSH agent first, falls back to file-based keys if agent fails.
-    Automatically cleans up resources on exit.
+    Setups are checked out from the process-wide SSHConnectionPool and released on exit.
     """
 
+    __slots__ = ('ssh_key', 'known_hosts', 'port', 'prefer_agent', 'ssh_opts', 'agent_pid',
+                 'ssh_key_file', 'known_hosts_file', '_using_agent', '_pool_key')
+
+    # Whether setups may be shared through the SSHConnectionPool
+    _poolable = True
+
     def __init__(self, ssh_key: str, known_hosts: str, port: int = 22, prefer_agent: bool = True):
         """Initialize SSH connection context.
 
@@ -688,13 +1118,27 @@ class SSHConnection:
         self.ssh_key_file = None
         self.known_hosts_file = None
         self._using_agent = False
+        self._pool_key = None
     
     def __enter__(self):
         """Setup SSH connection."""
-        start_time = time.time()
+        start_time = time.monotonic() if _TELEMETRY_ENABLED else 0
         success = False
         error = None
 
+        if self._poolable:
+            pool_key = SSHConnectionPool.make_key(self.ssh_key, self.known_hosts, self.port, self.prefer_agent)
+            entry = _SSH_POOL.acquire(pool_key)
+            if entry:
+                self._pool_key = pool_key
+                self.ssh_opts, self.agent_pid = entry.ssh_opts, entry.agent_pid
+                self.ssh_key_file, self.known_hosts_file = entry.ssh_key_file, entry.known_hosts_file
+                self._using_agent = bool(entry.agent_pid)
+                if _TELEMETRY_ENABLED:
+                    _track_ssh_operation("connection_setup", "pooled", True,
+                                       (time.monotonic() - start_time) * 1000)
+                return self
+
         try:
             if self.prefer_agent:
                 try:
@@ -703,13 +1147,15 @@ class SSHConnection:
                     )
                     self._using_agent = True
                     success = True
-                    _track_ssh_operation("connection_setup", "ssh-agent", True,
-                                       (time.time() - start_time) * 1000)
+                    self._add_to_pool()
+                    if _TELEMETRY_ENABLED:
+                        _track_ssh_operation("connection_setup", "ssh-agent", True,
+                                           (time.monotonic() - start_time) * 1000)
                     return self
                 except Exception as e:
                     error = str(e)
                     # Log warning and fall back to file-based
-                    if sys.stdout.isatty():
+                    if _IS_TTY:
                         print(colorize(f"SSH agent setup failed: {e}, falling back to file-based keys", 'YELLOW'))
 
             # File-based fallback
@@ -717,30 +1163,48 @@ class SSHConnection:
                 self.ssh_key, self.known_hosts, port=self.port
             )
             success = True
-            _track_ssh_operation("connection_setup", "file-based", True,
-                               (time.time() - start_time) * 1000)
+            self._add_to_pool()
+            if _TELEMETRY_ENABLED:
+                _track_ssh_operation("connection_setup", "file-based", True,
+                                   (time.monotonic() - start_time) * 1000)
             return self
         except Exception as e:
             error = str(e)
-            _track_ssh_operation("connection_setup", "unknown", False,
-                               (time.time() - start_time) * 1000, error)
+            if _TELEMETRY_ENABLED:
+                _track_ssh_operation("connection_setup", "unknown", False,
+                                   (time.monotonic() - start_time) * 1000, error)
             raise
     
+    def _add_to_pool(self):
+        if not self._poolable:
+            return
+        pool_key = SSHConnectionPool.make_key(self.ssh_key, self.known_hosts, self.port, self.prefer_agent)
+        entry = _PooledSSHSetup(self.ssh_opts, self.agent_pid, self.ssh_key_file, self.known_hosts_file)
+        if _SSH_POOL.add(pool_key, entry):
+            self._pool_key = pool_key
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Cleanup SSH resources."""
-        start_time = time.time()
+        """Release pooled SSH resources, or cleanup SSH resources that were not pooled."""
+        if self._pool_key:
+            _SSH_POOL.release(self._pool_key)
+            self._pool_key = None
+            return
+        start_time = time.monotonic() if _TELEMETRY_ENABLED else 0
         try:
             if self.agent_pid:
                 cleanup_ssh_agent(self.agent_pid, self.known_hosts_file)
-                _track_ssh_operation("connection_cleanup", "ssh-agent", True,
-                                   (time.time() - start_time) * 1000)
+                if _TELEMETRY_ENABLED:
+                    _track_ssh_operation("connection_cleanup", "ssh-agent", True,
+                                       (time.monotonic() - start_time) * 1000)
             elif self.ssh_key_file:
                 cleanup_ssh_key(self.ssh_key_file, self.known_hosts_file)
-                _track_ssh_operation("connection_cleanup", "file-based", True,
-                                   (time.time() - start_time) * 1000)
+                if _TELEMETRY_ENABLED:
+                    _track_ssh_operation("connection_cleanup", "file-based", True,
+                                       (time.monotonic() - start_time) * 1000)
         except Exception as e:
-            _track_ssh_operation("connection_cleanup", self.connection_method, False,
-                               (time.time() - start_time) * 1000, str(e))
+            if _TELEMETRY_ENABLED:
+                _track_ssh_operation("connection_cleanup", self.connection_method, False,
+                                   (time.monotonic() - start_time) * 1000, str(e))
     
     @property
     def is_using_agent(self) -> bool:
@@ -757,8 +1221,13 @@ class SSHTunnelConnection(SSHConnection):
 
     This is a special variant that doesn't automatically cleanup SSH resources
     on exit, allowing tunnels to persist. Cleanup must be done manually.
+    Tunnel setups are never pooled, since manual cleanup would tear them down for other users.
     """
 
+    __slots__ = ('_cleanup_on_exit',)
+
+    _poolable = False
+
     def __init__(self, ssh_key: str, known_hosts: str, prefer_agent: bool = True):
         """Initialize SSH tunnel connection context.
 
@@ -786,34 +1255,63 @@ class SSHTunnelConnection(SSHConnection):
         elif self.ssh_key_file:
             cleanup_ssh_key(self.ssh_key_file, self.known_hosts_file)
 
-def get_machine_connection_info(machine_info: Dict[str, Any]) -> Dict[str, Any]:
-    from .config import get_logger
-    logger = get_logger(__name__)
+# Accepted machine vault keys per field, in lookup order (the uppercase forms are the ones
+# _MISSING_IP_BANNER documents)
+_VAULT_FIELD_ALIASES = (
+    ('ip', 'IP'),
+    ('user', 'USER', 'ssh_user'),
+    ('datastore', 'DATASTORE'),
+    ('known_hosts', 'KNOWN_HOSTS'),  # SSH known_hosts entries
+    ('port', 'PORT'),
+)
+
+def _machine_vault_fields(vault: Dict[str, Any]) -> Tuple[Any, Any, Any, Any, Any]:
+    """Extract (ip, user, datastore, known_hosts, port) from a machine vault"""
+    ip, user, datastore, known_hosts, port = (
+        next((vault[key] for key in keys if key in vault), None) for keys in _VAULT_FIELD_ALIASES)
+    # Default to port 22 if not specified
+    return ip, user, datastore, known_hosts, 22 if port is None else port
+
+@functools.lru_cache(maxsize=256)
+def _parse_machine_vault(vault_content: str) -> Tuple[Any, Any, Any, Any, Any]:
+    """Parse each distinct vaultContent string once (JSONDecodeError is not cached)"""
+    return _machine_vault_fields(_json_loads(vault_content))
+
+# Resolved connection info per (machine, team, vaultContent), on the same TTL as the vault caches
+_CONNECTION_INFO_CACHE: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
 
+def get_machine_connection_info(machine_info: Dict[str, Any]) -> Dict[str, Any]:
     machine_name = machine_info.get('machineName')
     vault = machine_info.get('vault', {})
+    vault_content = machine_info.get('vaultContent')
 
-    if not vault:
-        vault_content = machine_info.get('vaultContent')
-        if vault_content:
-            if isinstance(vault_content, str):
-                try:
-                    vault = machine_info['vault'] = json.loads(vault_content)
-                except json.JSONDecodeError as e:
-                    print(colorize(f"Failed to parse vaultContent: {e}", 'RED'))
-
-    ip = vault.get('ip')
-    ssh_user = vault.get('user')
-    datastore = vault.get('datastore')
-    known_hosts = vault.get('known_hosts')  # SSH known_hosts entries
-    port = vault.get('port', 22)  # Default to port 22 if not specified
+    # Repeat calls for an unchanged machine skip validation and the universal user lookup
+    # (and don't repeat its warnings); only successfully resolved info is cached
+    cache_key = (machine_name, machine_info.get('teamName'), vault_content) if vault_content and isinstance(vault_content, str) else None
+    cached = _cache_get(_CONNECTION_INFO_CACHE, cache_key)
+    if cached is not None:
+        return dict(cached)
+
+    if vault and machine_info.get('_vault_parsed_for') is vault_content:
+        # Already decoded from this exact vaultContent by get_machine_info_with_team
+        ip, ssh_user, datastore, known_hosts, port = _machine_vault_fields(vault)
+    elif vault_content and isinstance(vault_content, str):
+        # vaultContent is the canonical form of the vault, so it doubles as the cache key
+        try:
+            ip, ssh_user, datastore, known_hosts, port = _parse_machine_vault(vault_content)
+        except json.JSONDecodeError as e:
+            if not vault:
+                print(colorize(f"Failed to parse vaultContent: {e}", 'RED'))
+            ip, ssh_user, datastore, known_hosts, port = _machine_vault_fields(vault)
+    else:
+        ip, ssh_user, datastore, known_hosts, port = _machine_vault_fields(vault)
 
     # DEBUG: Log machine vault info
-    logger.debug(f"[get_machine_connection_info] Machine '{machine_name}' vault:")
-    logger.debug(f"  - ip: {ip}")
-    logger.debug(f"  - user: {ssh_user}")
-    logger.debug(f"  - datastore: {datastore}")
-    logger.debug(f"  - port: {port}")
+    logger.debug("[get_machine_connection_info] Machine '%s' vault:", machine_name)
+    logger.debug("  - ip: %s", ip)
+    logger.debug("  - user: %s", ssh_user)
+    logger.debug("  - datastore: %s", datastore)
+    logger.debug("  - port: %s", port)
 
     # Validate required fields
     if not datastore:
@@ -831,20 +1329,18 @@ def get_machine_connection_info(machine_info: Dict[str, Any]) -> Dict[str, Any]:
         print(colorize("Warning: Using default universal user ID '7111'", 'YELLOW'))
 
     if not ssh_user:
-        print(colorize(f"ERROR: SSH user not found in machine vault. Vault contents: {vault}", 'RED'))
+        print(colorize(f"ERROR: SSH user not found in machine vault. Vault contents: {vault or vault_content}", 'RED'))
         raise ValueError(f"SSH user not found in machine vault for {machine_name}. The machine vault should contain 'user' field.")
 
     if not ip:
-        print(colorize(f"\n✗ Machine configuration error", 'RED'))
-        print(colorize(f"  Machine '{machine_name}' does not have an IP address configured", 'RED'))
-        print(colorize("\nThe machine vault must contain:", 'YELLOW'))
-        print(colorize("  • 'ip' or 'IP': The machine's IP address", 'YELLOW'))
-        print(colorize("  • 'user' or 'USER': SSH username", 'YELLOW'))
-        print(colorize("  • 'datastore' or 'DATASTORE': Datastore path (optional)", 'YELLOW'))
-        print(colorize("\nPlease update the machine configuration in the Rediacc console.", 'YELLOW'))
+        print_lines([_format_banner(_MISSING_IP_BANNER, machine_name=machine_name)])
         raise ValueError(f"Machine IP not found in vault for {machine_name}")
 
-    return {
+    # Intern so connections to machines sharing host key material hold one copy
+    if isinstance(known_hosts, str):
+        known_hosts = sys.intern(known_hosts)
+
+    connection_info = {
         'ip': ip,
         'user': ssh_user,
         'port': port,
@@ -854,52 +1350,52 @@ def get_machine_connection_info(machine_info: Dict[str, Any]) -> Dict[str, Any]:
         'team': machine_info.get('teamName'),
         'known_hosts': known_hosts
     }
+    _cache_put(_CONNECTION_INFO_CACHE, cache_key, connection_info)
+    return dict(connection_info)
 
 
-def get_repository_paths(repository_guid: str, datastore: str, universal_user_id: str = None, organization_id: str = None) -> Dict[str, str]:
-    """Calculate repository paths. universal_user_id and organization_id are kept for compatibility but no longer used in paths."""
-    from .config import get_logger
-    logger = get_logger(__name__)
+def get_repository_paths(repository_guid: str, datastore: str, universal_user_id: str = None, organization_id: str = None) -> Mapping[str, str]:
+    """Calculate repository paths. universal_user_id and organization_id are kept for compatibility but no longer used in paths.
 
-    # DEBUG: Log path construction inputs
-    logger.debug(f"[get_repository_paths] Constructing paths:")
-    logger.debug(f"  - repository_guid: {repository_guid}")
-    logger.debug(f"  - datastore: {datastore}")
+    The result is a shared read-only mapping, computed once per (repository_guid, datastore).
+    """
+    return _compute_repository_paths(repository_guid, datastore)
 
-    # Paths are now directly under datastore (no user/organization isolation)
-    base_path = datastore
-    docker_base = f"{base_path}/{INTERIM_FOLDER_NAME}/{repository_guid}/docker"
+@functools.lru_cache(maxsize=256)
+def _compute_repository_paths(repository_guid: str, datastore: str) -> Mapping[str, str]:
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-    logger.debug(f"  - base_path: {base_path}")
+    if debug:
+        logger.debug("[get_repository_paths] Constructing paths:")
+        logger.debug("  - repository_guid: %s", repository_guid)
+        logger.debug("  - datastore: %s", datastore)
 
+    # Paths are now directly under datastore (no user/organization isolation)
+    docker_base = datastore + _INTERIM_SEGMENT + repository_guid + "/docker"
     # Runtime paths are now flattened: /var/run/rediacc/{repository_guid}
-    runtime_base = f"/var/run/rediacc/{repository_guid}"
-    runtime_paths = {
-        'runtime_base': runtime_base,
-        'docker_socket': f"{runtime_base}/docker.sock",
-        'plugin_socket_dir': f"{runtime_base}/plugins",
-        'docker_exec': f"{runtime_base}/exec",
-    }
+    runtime_base = _RUNTIME_ROOT + repository_guid
 
     paths = {
-        'mount_path': f"{base_path}/{MOUNTS_FOLDER_NAME}/{repository_guid}",
-        'image_path': f"{base_path}/{REPOSITORIES_FOLDER_NAME}/{repository_guid}",
-        'immovable_path': f"{base_path}/{IMMOVABLE_FOLDER_NAME}/{repository_guid}",
+        'mount_path': datastore + _MOUNTS_SEGMENT + repository_guid,
+        'image_path': datastore + _REPOSITORIES_SEGMENT + repository_guid,
+        'immovable_path': datastore + _IMMOVABLE_SEGMENT + repository_guid,
         'docker_folder': docker_base,
-        'docker_socket': runtime_paths['docker_socket'],
-        'docker_data': f"{docker_base}/data",
-        'docker_exec': runtime_paths['docker_exec'],
-        'plugin_socket_dir': runtime_paths['plugin_socket_dir'],
-        **runtime_paths  # Include all runtime paths
+        'docker_socket': runtime_base + "/docker.sock",
+        'docker_data': docker_base + "/data",
+        'docker_exec': runtime_base + "/exec",
+        'plugin_socket_dir': runtime_base + "/plugins",
+        'runtime_base': runtime_base,
     }
 
-    # DEBUG: Log the final constructed paths
-    logger.debug(f"[get_repository_paths] Final paths:")
-    logger.debug(f"  - mount_path: {paths['mount_path']}")
-    logger.debug(f"  - image_path: {paths['image_path']}")
-    logger.debug(f"  - docker_folder: {paths['docker_folder']}")
+    if debug:
+        logger.debug("[get_repository_paths] Final paths:")
+        logger.debug("  - mount_path: %s", paths['mount_path'])
+        logger.debug("  - image_path: %s", paths['image_path'])
+        logger.debug("  - docker_folder: %s", paths['docker_folder'])
+
+    return MappingProxyType(paths)
 
-    return paths
+_CLI_TOOL_OK = False
 
 def initialize_cli_command(args, parser, requires_cli_tool=True):
     """Standard initialization for CLI commands.
@@ -920,14 +1416,40 @@ def initialize_cli_command(args, parser, requires_cli_tool=True):
     elif not TokenManager.get_token():
         parser.error("No authentication token available. Please login first.")
     
-    # Validate CLI tool if required
-    if requires_cli_tool:
+    # Validate CLI tool if required (only once per process; the install doesn't move)
+    global _CLI_TOOL_OK
+    if requires_cli_tool and not _CLI_TOOL_OK:
         if not os.path.exists(CLI_TOOL):
             error_exit(f"rediacc not found at {CLI_TOOL}")
         # Only check executable permissions for development installations
         # PyPI installations don't need cli_main.py to be executable (entry points handle execution)
         if not is_windows() and not is_pypi_installation() and not os.access(CLI_TOOL, os.X_OK):
             error_exit(f"rediacc is not executable at {CLI_TOOL}")
+        _CLI_TOOL_OK = True
+
+# Common argument definitions: name -> (flags, add_argument kwargs)
+_COMMON_ARGS = {
+    'token': (('--token',), {
+        'help': 'Authentication token (GUID) - uses saved token if not specified',
+        'required': False
+    }),
+    'team': (('--team',), {
+        'help': 'Team name',
+        'required': True
+    }),
+    'machine': (('--machine',), {
+        'help': 'Machine name',
+        'required': True
+    }),
+    'repository': (('--repository',), {
+        'help': 'Repository name',
+        'required': True
+    }),
+    'verbose': (('--verbose', '-v'), {
+        'action': 'store_true',
+        'help': 'Enable verbose logging output'
+    }),
+}
 
 def add_common_arguments(parser, include_args=None, required_overrides=None):
     """Add common arguments to an argument parser.
@@ -942,85 +1464,92 @@ def add_common_arguments(parser, include_args=None, required_overrides=None):
     Returns:
         parser: The modified parser (for chaining)
     """
-    # Define all common arguments with their configurations
-    common_args = {
-        'token': {
-            'flags': ['--token'],
-            'kwargs': {
-                'help': 'Authentication token (GUID) - uses saved token if not specified',
-                'required': False
-            }
-        },
-        'team': {
-            'flags': ['--team'],
-            'kwargs': {
-                'help': 'Team name',
-                'required': True
-            }
-        },
-        'machine': {
-            'flags': ['--machine'],
-            'kwargs': {
-                'help': 'Machine name',
-                'required': True
-            }
-        },
-        'repository': {
-            'flags': ['--repository'],
-            'kwargs': {
-                'help': 'Repository name',
-                'required': True
-            }
-        },
-        'verbose': {
-            'flags': ['--verbose', '-v'],
-            'kwargs': {
-                'action': 'store_true',
-                'help': 'Enable verbose logging output'
-            }
-        }
-    }
-    
     # If no specific args requested, include all
     if include_args is None:
-        include_args = list(common_args.keys())
-    
-    # Initialize required_overrides if not provided
-    if required_overrides is None:
-        required_overrides = {}
+        include_args = _COMMON_ARGS
     
     # Add requested arguments
     for arg_name in include_args:
-        if arg_name in common_args:
-            arg_config = common_args[arg_name].copy()
-            kwargs = arg_config['kwargs'].copy()
-            
-            # Apply required override if specified
-            if arg_name in required_overrides:
-                kwargs['required'] = required_overrides[arg_name]
-            
-            parser.add_argument(*arg_config['flags'], **kwargs)
+        spec = _COMMON_ARGS.get(arg_name)
+        if spec is None:
+            continue
+        flags, kwargs = spec
+        # Apply required override if specified, without mutating the shared spec
+        if required_overrides and arg_name in required_overrides:
+            kwargs = dict(kwargs, required=required_overrides[arg_name])
+        parser.add_argument(*flags, **kwargs)
     
     return parser
 
 def wait_for_enter(message: str = "Press Enter to continue..."):
     input(colorize(f"\n{message}", 'YELLOW'))
 
+_ADDRESS_CACHE_TTL = 60
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+
+@functools.lru_cache(maxsize=128)
+def _resolve_ssh_address(host: str, port: int, _bucket: int) -> Tuple[Tuple[Any, ...], ...]:
+    """Resolve host:port to stream socket addresses; _bucket expires entries after _ADDRESS_CACHE_TTL"""
+    import socket
+    return tuple(socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+
+def _connect_any(addresses, timeout: float) -> Optional[bool]:
+    """Start non-blocking connects to every address and wait on all of them with one select().
+
+    Returns True once any address accepts, False if all of them refuse, None on timeout.
+    """
+    import select
+    import socket
+    pending = []
+    try:
+        for family, socktype, proto, _, sockaddr in addresses:
+            sock = socket.socket(family, socktype, proto)
+            pending.append(sock)
+            sock.setblocking(False)
+            rc = sock.connect_ex(sockaddr)
+            if rc == 0:
+                return True
+            if rc not in _CONNECT_IN_PROGRESS:
+                pending.remove(sock)
+                sock.close()
+
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            # Windows reports failed connects through the exception set
+            _, writable, failed = select.select([], pending, pending, remaining)
+            if not writable and not failed:
+                return None
+            for sock in set(writable) | set(failed):
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0 and sock not in failed:
+                    return True
+                pending.remove(sock)
+                sock.close()
+        return False
+    finally:
+        for sock in pending:
+            sock.close()
+
 def test_ssh_connectivity(ip: str, port: int = 22, timeout: int = 5) -> Tuple[bool, str]:
     import socket
-    start_time = time.time()
+    start_time = time.monotonic() if _TELEMETRY_ENABLED else 0
     success = False
     error = ""
 
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            if sock.connect_ex((ip, port)) == 0:
-                success = True
-                result = (True, "")
-            else:
-                error = f"Cannot connect to {ip}:{port} - port appears to be closed or filtered"
-                result = (False, error)
+        addresses = _resolve_ssh_address(ip, port, int(time.monotonic() // _ADDRESS_CACHE_TTL))
+        connected = _connect_any(addresses, timeout)
+        if connected:
+            success = True
+            result = (True, "")
+        elif connected is None:
+            error = f"Connection to {ip}:{port} timed out after {timeout} seconds"
+            result = (False, error)
+        else:
+            error = f"Cannot connect to {ip}:{port} - port appears to be closed or filtered"
+            result = (False, error)
     except socket.timeout:
         error = f"Connection to {ip}:{port} timed out after {timeout} seconds"
         result = (False, error)
@@ -1032,31 +1561,46 @@ def test_ssh_connectivity(ip: str, port: int = 22, timeout: int = 5) -> Tuple[bo
         result = (False, error)
 
     # Track connectivity test
-    _track_ssh_operation("connectivity_test", ip, success,
-                       (time.time() - start_time) * 1000, error if not success else None)
+    if _TELEMETRY_ENABLED:
+        _track_ssh_operation("connectivity_test", ip, success,
+                           (time.monotonic() - start_time) * 1000, error if not success else None)
 
     return result
 
+# (ip, port) -> monotonic time of the last successful probe; failures are never cached
+_ACCESS_CACHE: Dict[Tuple[str, int], float] = {}
+_ACCESS_CACHE_TTL = 30
+
 def validate_machine_accessibility(machine_name: str, team_name: str, ip: str, port: int = 22, repository_name: str = None):
+    target = (ip, port)
+    proven_at = _ACCESS_CACHE.get(target)
+    if proven_at is not None and time.monotonic() - proven_at < _ACCESS_CACHE_TTL:
+        print(_MACHINE_ACCESSIBLE_LINE); return
+
     print(f"Testing connectivity to {ip}:{port}...")
     is_accessible, error_msg = test_ssh_connectivity(ip, port)
-    if is_accessible: print(colorize("✓ Machine is accessible", 'GREEN')); return
-
-    print(colorize(f"\n✗ Machine '{machine_name}' is not accessible", 'RED'))
-    print(colorize(f"  Error: {error_msg}", 'RED'))
-    print(colorize("\nPossible reasons:", 'YELLOW'))
-    for reason in ["The machine is offline or powered down", "Network connectivity issues between client and machine", f"Firewall blocking SSH port ({port})", "Incorrect IP address in machine configuration"]:
-        print(colorize(f"  • {reason}", 'YELLOW'))
+    if is_accessible:
+        _ACCESS_CACHE[target] = time.monotonic()
+        print(_MACHINE_ACCESSIBLE_LINE); return
 
-    print(colorize(f"\nMachine IP: {ip}", 'BLUE'))
-    print(colorize(f"Port: {port}", 'BLUE'))
-    print(colorize(f"Team: {team_name}", 'BLUE'))
+    lines = [_format_banner(_UNREACHABLE_MACHINE_BANNER, machine_name=machine_name, error=error_msg,
+                            port=port, ip=ip, team_name=team_name)]
     if repository_name:
-        print(colorize(f"Repository: {repository_name}", 'BLUE'))
-    print(colorize("\nPlease verify the machine is online and accessible from your network.", 'YELLOW'))
+        lines.append(_format_banner(_REPOSITORY_LINE, repository_name=repository_name))
+    lines.append(_VERIFY_MACHINE_HINT)
+    print_lines(lines)
     wait_for_enter("Press Enter to exit...")
     sys.exit(1)  # Keep as is - this is a special user interaction case
 
+_SSH_CONNECTION_FAILED_BANNER = _banner_template(
+    ("\n✗ {error}", 'RED'),
+    ("\nPossible reasons:", 'YELLOW'),
+    ("  • SSH authentication failed (check SSH key in team vault)", 'YELLOW'),
+    ("  • SSH host key verification failed", 'YELLOW'),
+    ("  • SSH service not running on the machine", 'YELLOW'),
+    ("  • Network connection interrupted", 'YELLOW'),
+)
+
 def handle_ssh_exit_code(returncode, connection_type: str = "machine"):
     # Handle None return code (process terminated by signal, normal for interactive exit)
     if returncode is None:
@@ -1069,39 +1613,68 @@ def handle_ssh_exit_code(returncode, connection_type: str = "machine"):
         print(colorize(f"\nDisconnected from {connection_type}.", 'GREEN'))
     elif returncode == 255:
         error = f"SSH connection failed (exit code: {returncode})"
-        print(colorize(f"\n✗ {error}", 'RED'))
-        print(colorize("\nPossible reasons:", 'YELLOW'))
-        reasons = [
-            "SSH authentication failed (check SSH key in team vault)",
-            "SSH host key verification failed",
-            "SSH service not running on the machine",
-            "Network connection interrupted"
-        ]
-        for reason in reasons:
-            print(colorize(f"  • {reason}", 'YELLOW'))
+        print_lines([_format_banner(_SSH_CONNECTION_FAILED_BANNER, error=error)])
     else:
         error = f"SSH disconnected with exit code {returncode}"
         print(colorize(f"\nDisconnected from {connection_type} (exit code: {returncode})", 'YELLOW'))
 
     # Track SSH command execution result
-    _track_ssh_operation("command_execution", connection_type, success, error=error)
+    if _TELEMETRY_ENABLED:
+        _track_ssh_operation("command_execution", connection_type, success, error=error)
 
 class RepositoryConnection:
+    __slots__ = ('team_name', 'machine_name', 'repository_name', '_machine_info', '_repository_info',
+                 '_repository_guid', '_connection_info', '_ssh_destination', '_repository_paths', '_ssh_key', '_ssh_key_file',
+                 '_session', '_connect_lock',
+                 # Temp files from setup_ssh(), recorded by callers for later cleanup_ssh()
+                 'ssh_key_file', 'known_hosts_file')
+
     def __init__(self, team_name: str, machine_name: str, repository_name: str):
+        """Set up a connection; no API calls are made until connect() or a property needs them"""
         self.team_name = team_name
         self.machine_name = machine_name
         self.repository_name = repository_name
+        self.ssh_key_file = None
+        self.known_hosts_file = None
         self._machine_info = None
         self._repository_info = None
+        self._repository_guid = None
         self._connection_info = None
+        self._ssh_destination = None
         self._repository_paths = None
         self._ssh_key = None
         self._ssh_key_file = None
+        self._session = None
+        # Reentrant: session() holds it while ssh_context() may resolve the SSH key
+        self._connect_lock = threading.RLock()
     
-    def connect(self):
-        from .config import get_logger
-        logger = get_logger(__name__)
-
+    def connect(self, refresh: bool = False):
+        """Resolve machine, repository and SSH key details for this connection up front.
+
+        Without connect(), each detail is fetched on first access instead, so callers that
+        only need machine-level details skip the repository and SSH key lookups.
+        Reconnecting an already connected instance reuses the resolved details and skips
+        the API round trips; SSH itself is re-established on the next ssh_context() or
+        session(). Pass refresh=True to fetch everything again.
+        """
+        # Serialize concurrent connect() calls on the same instance
+        with self._connect_lock:
+            if refresh or self._connection_info is None:
+                self._resolve_machine()
+            if refresh or self._repository_paths is None:
+                self._resolve_repository()
+            if refresh or not self._ssh_key:
+                self._resolve_ssh_key()
+
+    def _ensure(self, resolved: str, resolve):
+        """Run the resolve stage behind a lazily accessed attribute if connect() hasn't yet"""
+        if getattr(self, resolved) is None:
+            with self._connect_lock:
+                if getattr(self, resolved) is None:
+                    resolve()
+        return getattr(self, resolved)
+
+    def _resolve_machine(self):
         print("Fetching machine information...")
 
         self._machine_info = get_machine_info_with_team(self.team_name, self.machine_name)
@@ -1109,26 +1682,31 @@ class RepositoryConnection:
 
         if not all([self._connection_info.get('ip'), self._connection_info.get('user')]):
             error_exit("Machine IP or user not found in vault")
+        self._ssh_destination = f"{self._connection_info['user']}@{self._connection_info['ip']}"
 
+    def _resolve_repository(self):
+        if self._connection_info is None:
+            self._resolve_machine()
         print(f"Fetching repository information for '{self.repository_name}'...")
         self._repository_info = get_repository_info(self._connection_info['team'], self.repository_name)
 
         # DEBUG: Log GUID selection logic
         repository_guid = self._repository_info.get('repositoryGuid')
-        logger.debug(f"[RepositoryConnection.connect] GUID selection for '{self.repository_name}':")
-        logger.debug(f"  - repositoryGuid field: {repository_guid}")
+        logger.debug("[RepositoryConnection.connect] GUID selection for '%s':", self.repository_name)
+        logger.debug("  - repositoryGuid field: %s", repository_guid)
         if not repository_guid:
             print(colorize(f"Repository info: {json.dumps(self._repository_info, indent=2)}", 'YELLOW'))
             error_exit(f"Repository GUID not found for '{self.repository_name}'")
         logger.debug("  - Selected GUID: %s (from repositoryGuid)", repository_guid)
+        self._repository_guid = repository_guid
 
         _, universal_user_id, organization_id = _get_universal_user_info()
 
         # DEBUG: Log universal user and organization info
-        logger.debug(f"[RepositoryConnection.connect] Path components:")
-        logger.debug(f"  - universal_user_id: {universal_user_id}")
-        logger.debug(f"  - organization_id: {organization_id}")
-        logger.debug(f"  - datastore: {self._connection_info['datastore']}")
+        logger.debug("[RepositoryConnection.connect] Path components:")
+        logger.debug("  - universal_user_id: %s", universal_user_id)
+        logger.debug("  - organization_id: %s", organization_id)
+        logger.debug("  - datastore: %s", self._connection_info['datastore'])
 
         if not organization_id:
             error_exit("ORGANIZATION_ID not found. Please re-login or check your organization configuration.")
@@ -1141,19 +1719,21 @@ class RepositoryConnection:
         if not self._repository_paths:
             error_exit("Failed to calculate repository paths")
 
+    def _resolve_ssh_key(self):
+        if self._connection_info is None:
+            self._resolve_machine()
         print("Retrieving SSH key...")
         team_name = self._connection_info.get('team', self.team_name)
         self._ssh_key = get_ssh_key_from_vault(team_name)
         if not self._ssh_key:
             error_msg = f"SSH private key not found in vault for team '{team_name}'"
-            print(colorize(error_msg, 'RED'))
-            print(colorize("The team vault should contain 'SSH_PRIVATE_KEY' field with the SSH private key.", 'YELLOW'))
-            print(colorize("Please ensure SSH keys are properly configured in your team's vault settings.", 'YELLOW'))
+            print_lines([_format_banner(_MISSING_SSH_KEY_BANNER, error=error_msg)])
             raise Exception(error_msg)  # Raise exception instead of sys.exit so GUI can handle it
     
     def setup_ssh(self, ssh_executable: str = None) -> Tuple[str, str, str]:
+        ssh_key = self._ensure('_ssh_key', self._resolve_ssh_key)
         known_hosts = self._connection_info.get('known_hosts')
-        return setup_ssh_for_connection(self._ssh_key, known_hosts, ssh_executable)
+        return setup_ssh_for_connection(ssh_key, known_hosts, ssh_executable)
     
     def cleanup_ssh(self, ssh_key_file: str, known_hosts_file: str = None):
         cleanup_ssh_key(ssh_key_file, known_hosts_file)
@@ -1167,30 +1747,58 @@ class RepositoryConnection:
         Returns:
             SSHConnection context manager
         """
+        ssh_key = self._ensure('_ssh_key', self._resolve_ssh_key)
         known_hosts = self._connection_info.get('known_hosts')
         port = self._connection_info.get('port', 22)
-        return SSHConnection(self._ssh_key, known_hosts, port, prefer_agent)
+        return SSHConnection(ssh_key, known_hosts, port, prefer_agent)
+
+    def session(self, prefer_agent: bool = True) -> 'SSHConnection':
+        """Get a persistent SSH session held open until close().
+
+        The first call sets up an SSHConnection and keeps it checked out of the pool,
+        so its key material and ControlMaster socket outlive the pool idle timeout;
+        every command run with its ssh_opts only opens a new channel on that master.
+
+        Args:
+            prefer_agent: Whether to try SSH agent first (default: True)
+
+        Returns:
+            Entered SSHConnection; do not use it as a context manager
+        """
+        with self._connect_lock:
+            if self._session is None:
+                self._session = self.ssh_context(prefer_agent).__enter__()
+            return self._session
+
+    def close(self):
+        """Release the persistent SSH session, if one was opened"""
+        with self._connect_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.__exit__(None, None, None)
     
+    # Accessed before connect(), these fetch only what they need: machine-level details
+    # never trigger the repository lookup or the SSH key fetch
     @property
     def ssh_destination(self) -> str:
-        return f"{self._connection_info['user']}@{self._connection_info['ip']}"
+        return self._ensure('_ssh_destination', self._resolve_machine)
     
     @property
     def machine_info(self) -> Dict[str, Any]:
-        return self._machine_info
+        return self._ensure('_machine_info', self._resolve_machine)
     
     @property
     def repository_info(self) -> Dict[str, Any]:
-        return self._repository_info
+        return self._ensure('_repository_info', self._resolve_repository)
     
     @property
     def connection_info(self) -> Dict[str, Any]:
-        return self._connection_info
+        return self._ensure('_connection_info', self._resolve_machine)
     
     @property
-    def repository_paths(self) -> Dict[str, str]:
-        return self._repository_paths
+    def repository_paths(self) -> Mapping[str, str]:
+        return self._ensure('_repository_paths', self._resolve_repository)
     
     @property
     def repository_guid(self) -> str:
-        return self._repository_info.get('repositoryGuid')
+        return self._ensure('_repository_guid', self._resolve_repository)
@@ -6,15 +6,25 @@ Provides telemetry tracking for CLI operations, similar to the console's
 TypeScript telemetry service but adapted for Python CLI usage patterns.
 """
 
+import atexit
+import contextlib
+import functools
+import gzip
+import hashlib
+import itertools
 import json
+import math
 import platform
+import queue
+import subprocess
 import sys
 import time
 import uuid
 import threading
+import urllib.error
+import urllib.request
 from datetime import datetime
 from typing import Dict, Any, Optional, List
-from urllib.parse import urljoin
 import os
 
 # Try to import requests, fall back to urllib if not available
@@ -22,16 +32,76 @@ try:
     import requests
     HAS_REQUESTS = True
 except ImportError:
-    import urllib.request
-    import urllib.parse
     HAS_REQUESTS = False
 
+# Payloads are encoded once to compact UTF-8 bytes and sent as-is by either transport;
+# orjson is used when installed
+try:
+    import orjson
+    _json_dumps_bytes = orjson.dumps
+except ImportError:
+    def _json_dumps_bytes(data: Any) -> bytes:
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _hash_hostname() -> str:
+    """Create a privacy-safe hash of hostname for analytics"""
+    try:
+        hostname = platform.node() or 'unknown'
+        return hashlib.sha256(hostname.encode()).hexdigest()[:16]
+    except Exception:
+        return 'unknown'
+
+
+@functools.lru_cache(maxsize=None)
+def _platform_info() -> Dict[str, str]:
+    """Process-constant environment details; platform.platform() can be slow, so detect once"""
+    return {
+        'os': platform.system().lower(),
+        'os_version': platform.release(),
+        'arch': platform.machine(),
+        'python_version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+        'platform': platform.platform(),
+        'hostname_hash': _hash_hostname()
+    }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Wrap a value in its native OTLP AnyValue type (bool is checked before int)"""
+    value_type = type(value)
+    if value_type is str:
+        return {"stringValue": value}
+    if value_type is bool:
+        return {"boolValue": value}
+    if value_type is int:
+        return {"intValue": str(value)}  # OTLP/JSON encodes int64 as a string
+    if value_type is float and math.isfinite(value):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+# Queue marker: hand the unsent tail to a detached uploader process, then stop
+_SPOOL = object()
+
 
 class TelemetryService:
     """
     CLI Telemetry service for tracking user interactions and system performance
     """
 
+    QUEUE_SIZE = 1024
+    # Events are sent in one OTLP request per batch: when BATCH_SIZE events are
+    # pending, or FLUSH_INTERVAL seconds after the first one was queued
+    BATCH_SIZE = 32
+    FLUSH_INTERVAL = 2.0
+    # After this many consecutive failed sends, stop tracking for CIRCUIT_RESET seconds
+    CIRCUIT_THRESHOLD = 10
+    CIRCUIT_RESET = 300
+    # Payloads larger than this are sent gzip-compressed (level 1: cheap, and OTLP JSON compresses well)
+    GZIP_MIN_BYTES = 1024
+    # Token bucket per event name, so one noisy event can't crowd out the rest
+    RATE_LIMIT = 1000
+    RATE_WINDOW = 60.0
+
     def __init__(self,
                  endpoint: str = "https://www.rediacc.com/otlp/v1/traces",
                  service_name: str = "rediacc-cli",
@@ -41,35 +111,56 @@ class TelemetryService:
         self.service_name = service_name
         self.service_version = service_version
         self.enabled = enabled
+        self._debug = bool(os.environ.get('REDIACC_DEBUG') or os.environ.get('REDIACC_TELEMETRY_DEBUG'))
         self.session_id = self._generate_session_id()
-        self.session_start_time = time.time()
+        # All spans of a CLI session belong to one trace
+        self._trace_id = os.urandom(16).hex()
+        self.session_start_time = time.monotonic()  # durations only; wall-clock time goes in 'timestamp'
         self.user_context = {}
         self._init_lock = threading.Lock()
         self._initialized = False
+        # Events waiting for the background sender; None tells the worker to stop
+        self._queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._worker_thread: Optional[threading.Thread] = None
+        self._http = None  # requests.Session, created and used only by the worker thread
+        self.dropped_events = 0
+        self._failures = 0
+        self._circuit_open_until = 0.0
+        self._buckets: Dict[str, List[float]] = {}  # event name -> [tokens, last refill]
+        self._rate_lock = threading.Lock()
 
         # Environment detection
-        self.platform_info = {
-            'os': platform.system().lower(),
-            'os_version': platform.release(),
-            'arch': platform.machine(),
-            'python_version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            'platform': platform.platform(),
-            'hostname_hash': self._hash_hostname()
+        self.platform_info = dict(_platform_info())
+        self._refresh_event_base()
+
+        # OTLP resource and scope never change after construction; every batch reuses them
+        self._otlp_resource = {
+            "attributes": [
+                {"key": "service.name", "value": {"stringValue": self.service_name}},
+                {"key": "service.version", "value": {"stringValue": self.service_version}},
+                {"key": "telemetry.sdk.name", "value": {"stringValue": "rediacc-cli-python"}},
+                {"key": "telemetry.sdk.version", "value": {"stringValue": "1.0.0"}}
+            ]
+        }
+        self._otlp_scope = {
+            "name": "rediacc-cli-events",
+            "version": "1.0.0"
+        }
+
+    def _refresh_event_base(self):
+        """Merge the per-session event fields once, instead of on every event"""
+        self._event_base = {
+            'session_id': self.session_id,
+            'service_name': self.service_name,
+            'service_version': self.service_version,
+            **self.platform_info,
+            **self.user_context
         }
 
     def _generate_session_id(self) -> str:
         """Generate a unique session ID"""
         return f"cli_session_{int(time.time())}_{uuid.uuid4().hex[:8]}"
 
-    def _hash_hostname(self) -> str:
-        """Create a privacy-safe hash of hostname for analytics"""
-        try:
-            import hashlib
-            hostname = platform.node() or 'unknown'
-            return hashlib.sha256(hostname.encode()).hexdigest()[:16]
-        except Exception:
-            return 'unknown'
-
     def initialize(self, user_context: Optional[Dict[str, Any]] = None) -> bool:
         """Initialize telemetry service with user context"""
         with self._init_lock:
@@ -79,6 +170,9 @@ class TelemetryService:
             try:
                 if user_context:
                     self.user_context = user_context
+                    self._refresh_event_base()
+
+                self._start_worker()
 
                 # Track CLI session start
                 self.track_event('cli.session_start', {
@@ -100,49 +194,168 @@ class TelemetryService:
             'organization': organization or 'unknown',
             **kwargs
         })
+        self._refresh_event_base()
 
     def track_event(self, event_name: str, attributes: Optional[Dict[str, Any]] = None):
         """Track a telemetry event"""
         if not self.enabled or not self._initialized:
             return
+        # Endpoint keeps failing; don't queue events that would only time out
+        if self._circuit_open_until and time.monotonic() < self._circuit_open_until:
+            return
+        if not self._allow_event(event_name):
+            self.dropped_events += 1
+            return
 
         try:
             # Prepare event data
             event_data = {
                 'event_name': event_name,
                 'timestamp': int(time.time() * 1000),  # milliseconds
-                'session_id': self.session_id,
-                'session_duration_ms': int((time.time() - self.session_start_time) * 1000),
-                'service_name': self.service_name,
-                'service_version': self.service_version,
-                **self.platform_info,
-                **self.user_context,
-                **(attributes or {})
+                'session_duration_ms': int((time.monotonic() - self.session_start_time) * 1000),
+                **self._event_base
             }
+            if attributes:
+                event_data.update(attributes)
 
-            # Send telemetry data
-            self._send_telemetry_data(event_data)
+            # Hand off to the worker; the caller never waits on the network
+            self._queue.put_nowait(event_data)
 
+        except queue.Full:
+            self.dropped_events += 1
         except Exception as e:
             self._log_error(f"Failed to track event {event_name}: {e}")
 
+    def _allow_event(self, event_name: str) -> bool:
+        """Take a token from the event's bucket; False once it is empty"""
+        now = time.monotonic()
+        with self._rate_lock:
+            bucket = self._buckets.get(event_name)
+            if bucket is None:
+                self._buckets[event_name] = [self.RATE_LIMIT - 1.0, now]
+                return True
+            tokens = min(self.RATE_LIMIT, bucket[0] + (now - bucket[1]) * self.RATE_LIMIT / self.RATE_WINDOW)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                return False
+            bucket[0] = tokens - 1
+            return True
+
+    def _start_worker(self):
+        """Start the background sender thread (called under _init_lock)"""
+        if self._worker_thread is None:
+            self._worker_thread = threading.Thread(target=self._worker, name='rediacc-telemetry', daemon=True)
+            self._worker_thread.start()
+            atexit.register(self.flush, 2.0, True)
+
+    def _worker(self):
+        pending: List[Dict[str, Any]] = []
+        deadline = None
+        while True:
+            try:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                data = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                data = False
+
+            if data is _SPOOL:
+                if pending and not self._spool_events(pending):
+                    self._send_telemetry_data(pending)
+                pending = []
+                data = None
+            elif data:
+                if not pending:
+                    deadline = time.monotonic() + self.FLUSH_INTERVAL
+                pending.append(data)
+                if len(pending) < self.BATCH_SIZE:
+                    continue
+
+            if pending:
+                self._send_telemetry_data(pending)
+                pending = []
+                deadline = None
+            if data is None:
+                if self._http is not None:
+                    self._http.close()
+                    self._http = None
+                return
+
+    def flush(self, timeout: float = 2.0, spool: bool = False):
+        """Stop the worker once queued events are handled, waiting at most timeout seconds.
+
+        With spool=True the last partial batch is written to disk and uploaded by a
+        detached process, so the exiting CLI doesn't wait for the HTTP request.
+        """
+        thread, self._worker_thread = self._worker_thread, None
+        if thread is None:
+            return
+        try:
+            self._queue.put(_SPOOL if spool else None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout)
+        if self.dropped_events:
+            self._log_error(f"Dropped {self.dropped_events} telemetry events (queue full or rate limited)")
+
+    def _spool_events(self, events: List[Dict[str, Any]]) -> bool:
+        """Write events to the spool directory and start a detached uploader for them"""
+        if getattr(sys, 'frozen', False):
+            return False  # no interpreter to run the uploader with
+        path = None
+        try:
+            from .config import get_telemetry_spool_dir
+            path = get_telemetry_spool_dir() / f'{self.session_id}.ndjson'
+            with open(path, 'wb') as f:
+                # Header line: what the uploader needs to send them as this service would
+                f.write(_json_dumps_bytes({
+                    'endpoint': self.endpoint,
+                    'service_name': self.service_name,
+                    'service_version': self.service_version,
+                    'trace_id': self._trace_id
+                }) + b'\n')
+                f.writelines(_json_dumps_bytes(event) + b'\n' for event in events)
+
+            if sys.platform == 'win32':
+                detach = {'creationflags': subprocess.CREATE_NO_WINDOW}
+            else:
+                detach = {'start_new_session': True}
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), '--upload', str(path)],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                close_fds=True, **detach
+            )
+            return True
+        except Exception as e:
+            self._log_error(f"Failed to spool telemetry events: {e}")
+            if path is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(path)
+            return False
+
     def track_command_execution(self, command: str, args: List[str],
                                duration_ms: float, success: bool,
                                error: Optional[str] = None, **kwargs):
         """Track CLI command execution"""
-        self.track_event('cli.command_executed', {
+        if not self.enabled or not self._initialized:
+            return
+        attributes = {
             'command.name': command,
             'command.args_count': len(args),
             'command.duration_ms': duration_ms,
             'command.success': success,
             'command.error': error or '',
-            'command.has_flags': any(arg.startswith('-') for arg in args),
-            **kwargs
-        })
+            'command.has_flags': any(arg[:1] == '-' for arg in args)
+        }
+        if kwargs:
+            attributes.update(kwargs)
+        self.track_event('cli.command_executed', attributes)
 
     def track_api_call(self, method: str, endpoint: str, status_code: Optional[int] = None,
                       duration_ms: Optional[float] = None, error: Optional[str] = None):
         """Track API call performance and results"""
+        if not self.enabled or not self._initialized:
+            return
         self.track_event('cli.api_call', {
             'api.method': method.upper(),
             'api.endpoint': endpoint,
@@ -155,8 +368,9 @@ class TelemetryService:
     def track_ssh_operation(self, operation: str, host: str, success: bool,
                            duration_ms: Optional[float] = None, error: Optional[str] = None):
         """Track SSH operations (connections, file transfers, etc.)"""
+        if not self.enabled or not self._initialized:
+            return
         # Hash host for privacy
-        import hashlib
         host_hash = hashlib.sha256(host.encode()).hexdigest()[:16]
 
         self.track_event('cli.ssh_operation', {
@@ -170,6 +384,8 @@ class TelemetryService:
     def track_file_operation(self, operation: str, file_count: int, total_size_bytes: int,
                             duration_ms: float, success: bool, error: Optional[str] = None):
         """Track file operations (sync, upload, download)"""
+        if not self.enabled or not self._initialized:
+            return
         self.track_event('cli.file_operation', {
             'file.operation': operation,
             'file.count': file_count,
@@ -182,11 +398,17 @@ class TelemetryService:
 
     def track_error(self, error_type: str, error_message: str, context: Optional[Dict[str, Any]] = None):
         """Track CLI errors and exceptions"""
-        self.track_event('cli.error_occurred', {
+        if not self.enabled or not self._initialized:
+            return
+        attributes = {
             'error.type': error_type,
             'error.message': error_message[:200],  # Limit message length
-            'error.context': json.dumps(context or {})[:500],  # Limit context size
-        })
+        }
+        if context:
+            # Limit context size: first 16 entries, one short attribute each
+            for key, value in itertools.islice(context.items(), 16):
+                attributes[f'error.context.{key}'] = str(value)[:100]
+        self.track_event('cli.error_occurred', attributes)
 
     def shutdown(self):
         """Shutdown telemetry service and send final metrics"""
@@ -194,7 +416,7 @@ class TelemetryService:
             return
 
         try:
-            session_duration = int((time.time() - self.session_start_time) * 1000)
+            session_duration = int((time.monotonic() - self.session_start_time) * 1000)
             self.track_event('cli.session_end', {
                 'session.total_duration_ms': session_duration
             })
@@ -202,85 +424,106 @@ class TelemetryService:
         except Exception as e:
             self._log_error(f"Failed to shutdown telemetry: {e}")
 
-    def _send_telemetry_data(self, data: Dict[str, Any]):
-        """Send telemetry data to the endpoint"""
+        self.flush(spool=True)
+
+    def _send_telemetry_data(self, events: List[Dict[str, Any]]):
+        """Send a batch of telemetry events to the endpoint in one request"""
         try:
             # Convert to OpenTelemetry-like format
-            trace_data = self._convert_to_otlp_format(data)
+            trace_data = self._convert_batch_to_otlp(events)
+
+            payload = _json_dumps_bytes(trace_data)
+            headers = {}
+            if len(payload) > self.GZIP_MIN_BYTES:
+                payload = gzip.compress(payload, compresslevel=1)
+                headers['Content-Encoding'] = 'gzip'
 
             if HAS_REQUESTS:
-                self._send_with_requests(trace_data)
+                sent = self._send_with_requests(payload, headers)
             else:
-                self._send_with_urllib(trace_data)
+                sent = self._send_with_urllib(payload, headers)
 
         except Exception as e:
             self._log_error(f"Failed to send telemetry data: {e}")
+            sent = False
+
+        self._record_send_result(sent)
+
+    def _record_send_result(self, sent: bool):
+        """Open the circuit after CIRCUIT_THRESHOLD consecutive failures, close it on success"""
+        if sent:
+            self._failures = 0
+            self._circuit_open_until = 0.0
+            return
+        self._failures += 1
+        if self._failures >= self.CIRCUIT_THRESHOLD:
+            self._circuit_open_until = time.monotonic() + self.CIRCUIT_RESET
+            self._log_error(f"Telemetry disabled for {self.CIRCUIT_RESET}s after {self._failures} failed sends")
 
-    def _convert_to_otlp_format(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert event data to OpenTelemetry format"""
+    def _convert_batch_to_otlp(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert a batch of events to one OpenTelemetry envelope, one span per event"""
         return {
             "resourceSpans": [{
-                "resource": {
-                    "attributes": [
-                        {"key": "service.name", "value": {"stringValue": self.service_name}},
-                        {"key": "service.version", "value": {"stringValue": self.service_version}},
-                        {"key": "telemetry.sdk.name", "value": {"stringValue": "rediacc-cli-python"}},
-                        {"key": "telemetry.sdk.version", "value": {"stringValue": "1.0.0"}}
-                    ]
-                },
+                "resource": self._otlp_resource,
                 "scopeSpans": [{
-                    "scope": {
-                        "name": "rediacc-cli-events",
-                        "version": "1.0.0"
-                    },
-                    "spans": [{
-                        "traceId": uuid.uuid4().hex,
-                        "spanId": uuid.uuid4().hex[:16],
-                        "name": data.get('event_name', 'unknown_event'),
-                        "startTimeUnixNano": data.get('timestamp', int(time.time() * 1000)) * 1000000,
-                        "endTimeUnixNano": (data.get('timestamp', int(time.time() * 1000)) + 1) * 1000000,
-                        "attributes": [
-                            {"key": k, "value": {"stringValue": str(v)}}
-                            for k, v in data.items()
-                        ]
-                    }]
+                    "scope": self._otlp_scope,
+                    "spans": [self._convert_to_otlp_span(data) for data in events]
                 }]
             }]
         }
 
-    def _send_with_requests(self, data: Dict[str, Any]):
-        """Send telemetry using requests library"""
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': f'{self.service_name}/{self.service_version}'
+    def _convert_to_otlp_span(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert event data to an OpenTelemetry span"""
+        return {
+            "traceId": self._trace_id,
+            "spanId": os.urandom(8).hex(),
+            "name": data.get('event_name', 'unknown_event'),
+            "startTimeUnixNano": data.get('timestamp', int(time.time() * 1000)) * 1000000,
+            "endTimeUnixNano": (data.get('timestamp', int(time.time() * 1000)) + 1) * 1000000,
+            "attributes": [
+                {"key": k, "value": _otlp_value(v)}
+                for k, v in data.items()
+            ]
         }
 
+    def _get_http_session(self):
+        """Keep-alive session so later batches skip the TCP/TLS handshake"""
+        if self._http is None:
+            session = requests.Session()
+            session.headers.update({
+                'Content-Type': 'application/json',
+                'User-Agent': f'{self.service_name}/{self.service_version}'
+            })
+            session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+            self._http = session
+        return self._http
+
+    def _send_with_requests(self, payload: bytes, headers: Dict[str, str]) -> bool:
+        """Send telemetry using requests library; False if the endpoint is failing"""
         try:
-            response = requests.post(
+            response = self._get_http_session().post(
                 self.endpoint,
-                json=data,
+                data=payload,
                 headers=headers,
                 timeout=10
             )
             # Don't raise for HTTP errors - telemetry should be non-blocking
-            if response.status_code >= 400:
+            if response.status_code >= 400 and self._debug:
                 self._log_error(f"Telemetry server returned HTTP {response.status_code}: {response.text[:200]}")
+            return response.status_code < 500
         except requests.exceptions.RequestException as e:
             self._log_error(f"Telemetry request failed: {e}")
+            return False
 
-    def _send_with_urllib(self, data: Dict[str, Any]):
-        """Send telemetry using urllib (fallback)"""
-        import urllib.request
-        import urllib.error
-
-        json_data = json.dumps(data).encode('utf-8')
-
+    def _send_with_urllib(self, payload: bytes, headers: Dict[str, str]) -> bool:
+        """Send telemetry using urllib (fallback); False if the endpoint is failing"""
         req = urllib.request.Request(
             self.endpoint,
-            data=json_data,
+            data=payload,
             headers={
                 'Content-Type': 'application/json',
-                'User-Agent': f'{self.service_name}/{self.service_version}'
+                'User-Agent': f'{self.service_name}/{self.service_version}',
+                **headers
             }
         )
 
@@ -288,16 +531,19 @@ class TelemetryService:
             with urllib.request.urlopen(req, timeout=10) as response:
                 if response.status >= 400:
                     self._log_error(f"Telemetry server returned HTTP {response.status}")
+                return response.status < 500
         except urllib.error.HTTPError as e:
             self._log_error(f"Telemetry HTTP error: {e.code} - {e.reason}")
+            return e.code < 500
         except urllib.error.URLError as e:
             self._log_error(f"Telemetry URL error: {e}")
         except Exception as e:
             self._log_error(f"Telemetry request failed: {e}")
+        return False
 
     def _log_error(self, message: str):
         """Log telemetry errors (only in debug mode)"""
-        if os.environ.get('REDIACC_DEBUG') or os.environ.get('REDIACC_TELEMETRY_DEBUG'):
+        if self._debug:
             print(f"[Telemetry Debug] {message}", file=sys.stderr)
 
 
@@ -305,18 +551,21 @@ class TelemetryService:
 _telemetry_instance: Optional[TelemetryService] = None
 
 
+@functools.lru_cache(maxsize=None)
+def telemetry_opted_out() -> bool:
+    """Check the telemetry opt-out switches (read once per process)"""
+    return (
+        os.environ.get('REDIACC_TELEMETRY_DISABLED', '').lower() in ('1', 'true', 'yes') or
+        os.environ.get('DO_NOT_TRACK', '').lower() in ('1', 'true', 'yes')
+    )
+
+
 def get_telemetry_service() -> TelemetryService:
     """Get or create the global telemetry service instance"""
     global _telemetry_instance
 
     if _telemetry_instance is None:
-        # Check if telemetry is disabled
-        enabled = not (
-            os.environ.get('REDIACC_TELEMETRY_DISABLED', '').lower() in ('1', 'true', 'yes') or
-            os.environ.get('DO_NOT_TRACK', '').lower() in ('1', 'true', 'yes')
-        )
-
-        _telemetry_instance = TelemetryService(enabled=enabled)
+        _telemetry_instance = TelemetryService(enabled=not telemetry_opted_out())
 
     return _telemetry_instance
 
@@ -354,7 +603,7 @@ def track_command(command_name: str):
     """Decorator to automatically track command execution"""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.monotonic()
             success = False
             error = None
 
@@ -366,7 +615,7 @@ def track_command(command_name: str):
                 error = str(e)
                 raise
             finally:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.monotonic() - start_time) * 1000
                 track_command_execution(
                     command_name,
                     sys.argv[1:],
@@ -380,26 +629,42 @@ def track_command(command_name: str):
 
 
 # Context manager for operation tracking
-class track_operation:
+@contextlib.contextmanager
+def track_operation(operation_name: str, **attributes):
     """Context manager for tracking operations with automatic timing"""
+    start_time = time.monotonic()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        track_event(f'cli.operation.{operation_name}', {
+            'operation.duration_ms': (time.monotonic() - start_time) * 1000,
+            'operation.success': error is None,
+            'operation.error': str(error) if error else '',
+            **attributes
+        })
+
 
-    def __init__(self, operation_name: str, **attributes):
-        self.operation_name = operation_name
-        self.attributes = attributes
-        self.start_time = None
-
-    def __enter__(self):
-        self.start_time = time.time()
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        duration_ms = (time.time() - self.start_time) * 1000
-        success = exc_type is None
-        error = str(exc_val) if exc_val else None
-
-        track_event(f'cli.operation.{self.operation_name}', {
-            'operation.duration_ms': duration_ms,
-            'operation.success': success,
-            'operation.error': error or '',
-            **self.attributes
-        })
\ No newline at end of file
+def _upload_spool_file(path: str):
+    """Send events spooled by an exited CLI process in one request, then delete the file"""
+    try:
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            events = [json.loads(line) for line in f if line.strip()]
+        if events:
+            service = TelemetryService(endpoint=header['endpoint'], service_name=header['service_name'],
+                                       service_version=header['service_version'])
+            service._trace_id = header['trace_id']
+            service._send_telemetry_data(events)
+    finally:
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+
+if __name__ == '__main__':
+    # Detached uploader started by TelemetryService._spool_events
+    if len(sys.argv) == 3 and sys.argv[1] == '--upload':
+        _upload_spool_file(sys.argv[2])
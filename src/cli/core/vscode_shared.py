@@ -18,6 +18,7 @@ VS Code Installation Support:
 import os
 import re
 import json
+import functools
 import shutil
 import stat
 import platform
@@ -26,10 +27,11 @@ import subprocess
 from cli.core.shared import _decode_ssh_key, _decode_known_hosts, is_windows
 
 
-def get_vscode_settings_path():
+@functools.lru_cache(maxsize=1)
+def _detect_platform():
     """
-    Get the VS Code user settings.json path based on the operating system.
-    Includes WSL support for better Windows VS Code integration.
+    Return (platform.system(), is_wsl) for this process.
+    Neither can change while the process runs, so /proc/version is read once.
     """
     system = platform.system()
 
@@ -43,6 +45,17 @@ def get_vscode_settings_path():
         except (IOError, PermissionError):
             pass
 
+    return system, is_wsl
+
+
+@functools.lru_cache(maxsize=1)
+def get_vscode_settings_path():
+    """
+    Get the VS Code user settings.json path based on the operating system.
+    Includes WSL support for better Windows VS Code integration.
+    """
+    system, is_wsl = _detect_platform()
+
     if is_wsl:
         # In WSL, try Windows user profile first for better VS Code integration
         vscode_settings_paths = []
@@ -82,6 +95,7 @@ def get_vscode_settings_path():
         return os.path.join(xdg_config, 'Code', 'User', 'settings.json')
 
 
+@functools.lru_cache(maxsize=1)
 def get_rediacc_ssh_config_path():
     """Get the path to the rediacc-specific SSH config file."""
     return os.path.expanduser('~/.ssh/config_rediacc')
@@ -91,7 +105,16 @@ def find_vscode_executable():
     """
     Find VS Code executable on the system.
     Supports Windows, macOS, Linux, and WSL environments.
+    A found executable is remembered for the process; a miss is retried on the next call.
     """
+    vscode_path = _find_vscode_executable()
+    if vscode_path is None:
+        _find_vscode_executable.cache_clear()
+    return vscode_path
+
+
+@functools.lru_cache(maxsize=1)
+def _find_vscode_executable():
     # Check environment variable first
     vscode_path = os.environ.get('REDIACC_VSCODE_PATH')
     if vscode_path:
@@ -100,16 +123,8 @@ def find_vscode_executable():
         if shutil.which(vscode_path):
             return vscode_path
 
-    # Detect WSL environment
-    is_wsl = False
-    system = platform.system().lower()
-    if system == 'linux':
-        try:
-            if os.path.exists('/proc/version'):
-                with open('/proc/version', 'r') as f:
-                    is_wsl = 'microsoft' in f.read().lower()
-        except (IOError, PermissionError):
-            pass
+    system, is_wsl = _detect_platform()
+    system = system.lower()
 
     # Platform-specific candidates
     if system == 'linux':
@@ -140,6 +155,19 @@ def find_vscode_executable():
     return None
 
 
+class _HostnameTranslation(dict):
+    """str.translate table: ASCII letters, digits, '.' and '-' map to themselves, anything else to '-'"""
+
+    def __missing__(self, codepoint):
+        return '-'
+
+
+_HOSTNAME_TRANSLATION = _HostnameTranslation(
+    (ord(c), ord(c)) for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-'
+)
+_MULTI_HYPHEN_RE = re.compile(r'-+')
+
+
 def sanitize_hostname(name: str) -> str:
     """
     Sanitize name for use as SSH hostname (VS Code compatible).
@@ -150,15 +178,18 @@ def sanitize_hostname(name: str) -> str:
 
     # Replace spaces and other invalid characters with hyphens
     # Keep only alphanumeric characters, hyphens, and dots
-    sanitized = re.sub(r'[^a-zA-Z0-9.-]', '-', name)
+    sanitized = name.translate(_HOSTNAME_TRANSLATION)
     # Remove multiple consecutive hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _MULTI_HYPHEN_RE.sub('-', sanitized)
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip('-')
     # Ensure it's not empty
     return sanitized if sanitized else 'default'
 
 
+_SSH_CONFIG_MARKER = "# Rediacc VS Code connection"
+
+
 def resolve_universal_user(connection_value: str = None, fallback_value: str = None) -> str:
     """
     Choose the sudo target user, preferring explicit connection metadata.
@@ -177,31 +208,32 @@ def upsert_ssh_config_entry(ssh_config_path: str, connection_name: str, ssh_conf
     """
     os.makedirs(os.path.dirname(ssh_config_path), exist_ok=True)
 
-    block = "# Rediacc VS Code connection\n" + ssh_config_entry.rstrip() + "\n\n"
+    block = _SSH_CONFIG_MARKER + "\n" + ssh_config_entry.rstrip() + "\n\n"
     block_lines = block.splitlines(keepends=True)
+    target = f"Host {connection_name}"
 
+    # Single pass: copy lines through, swapping the first matching block
+    # (up to the next Host directive) for the new one
     lines = []
+    action = None
+    skipping = False
     if os.path.exists(ssh_config_path):
         with open(ssh_config_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-    start = end = None
-    for idx, line in enumerate(lines):
-        if line.strip() == f"Host {connection_name}":
-            start = idx
-            if idx > 0 and lines[idx - 1].strip() == "# Rediacc VS Code connection":
-                start = idx - 1
-            end = len(lines)
-            for j in range(idx + 1, len(lines)):
-                if lines[j].startswith("Host "):
-                    end = j
-                    break
-            break
-
-    if start is not None:
-        lines[start:end] = block_lines
-        action = "updated"
-    else:
+            for line in f:
+                if skipping:
+                    if not line.startswith("Host "):
+                        continue
+                    skipping = False
+                elif action is None and line.strip() == target:
+                    if lines and lines[-1].strip() == _SSH_CONFIG_MARKER:
+                        lines.pop()
+                    lines.extend(block_lines)
+                    action = "updated"
+                    skipping = True
+                    continue
+                lines.append(line)
+
+    if action is None:
         if lines:
             if not lines[-1].endswith('\n'):
                 lines[-1] += '\n'
@@ -237,7 +269,8 @@ def build_ssh_config_options(ssh_conn, identity_file_path: str, known_hosts_file
                 option = opts[i + 1]
                 if '=' in option:
                     key, value = option.split('=', 1)
-                    if key not in ['IdentityFile', 'UserKnownHostsFile']:
+                    # Control* options and IdentityAgent point at this process's sockets and agent
+                    if key not in ['IdentityFile', 'UserKnownHostsFile', 'IdentityAgent'] and not key.startswith('Control'):
                         line = f"    {key} {value}"
                         if line not in ssh_opts_lines:
                             ssh_opts_lines.append(line)
@@ -250,6 +283,36 @@ def build_ssh_config_options(ssh_conn, identity_file_path: str, known_hosts_file
     return ssh_opts_lines
 
 
+def _write_if_changed(path: str, content: str, mode: int):
+    """
+    Write content to path unless the file already holds exactly that, then apply mode.
+    A size mismatch from stat() settles most changes without reading the file,
+    and chmod is skipped when the existing file already has the mode.
+    """
+    data = content.encode('utf-8')
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+
+    if st is not None and st.st_size == len(data):
+        with open(path, 'rb') as existing_file:
+            if existing_file.read() != data:
+                st = None
+    else:
+        st = None
+
+    if st is None:
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    if st is None or stat.S_IMODE(st.st_mode) != mode:
+        try:
+            os.chmod(path, mode)
+        except (PermissionError, NotImplementedError, OSError):
+            pass
+
+
 def ensure_persistent_identity_file(team: str, machine: str, repository: str, ssh_key: str) -> str:
     """
     Persist the SSH private key for VS Code connections and return config-safe path.
@@ -269,25 +332,7 @@ def ensure_persistent_identity_file(team: str, machine: str, repository: str, ss
     key_path = os.path.join(ssh_dir, key_filename)
 
     decoded_key = _decode_ssh_key(ssh_key)
-
-    existing_content = None
-    try:
-        with open(key_path, 'r', encoding='utf-8') as existing_file:
-            existing_content = existing_file.read()
-    except FileNotFoundError:
-        existing_content = None
-
-    if existing_content != decoded_key:
-        with open(key_path, 'w', newline='\n', encoding='utf-8') as key_file:
-            key_file.write(decoded_key)
-
-    try:
-        if is_windows():
-            os.chmod(key_path, stat.S_IREAD | stat.S_IWRITE)
-        else:
-            os.chmod(key_path, 0o600)
-    except (PermissionError, NotImplementedError, OSError):
-        pass
+    _write_if_changed(key_path, decoded_key, stat.S_IREAD | stat.S_IWRITE if is_windows() else 0o600)
 
     return key_path.replace('\\', '/')
 
@@ -311,22 +356,7 @@ def ensure_persistent_known_hosts_file(team: str, machine: str, repository: str,
     known_hosts_path = os.path.join(ssh_dir, known_hosts_filename)
 
     decoded_known_hosts = _decode_known_hosts(known_hosts)
-
-    existing_content = None
-    try:
-        with open(known_hosts_path, 'r', encoding='utf-8') as existing_file:
-            existing_content = existing_file.read().strip()
-    except FileNotFoundError:
-        existing_content = None
-
-    if existing_content != decoded_known_hosts:
-        with open(known_hosts_path, 'w', newline='\n', encoding='utf-8') as kh_file:
-            kh_file.write(decoded_known_hosts + '\n')
-
-    try:
-        os.chmod(known_hosts_path, 0o644)
-    except (PermissionError, NotImplementedError, OSError):
-        pass
+    _write_if_changed(known_hosts_path, decoded_known_hosts + '\n', 0o644)
 
     return known_hosts_path.replace('\\', '/')
 
@@ -372,6 +402,9 @@ def ensure_vscode_settings_configured(logger, connection_name: str = None, unive
             logger.warning(f"Could not read VS Code settings: {e}")
             settings = {}
 
+    # Normalized snapshot, so the file is only rewritten when its content really changes
+    original_settings = json.dumps(settings, sort_keys=True)
+
     # Track if we need to update
     needs_update = False
 
@@ -435,7 +468,7 @@ def ensure_vscode_settings_configured(logger, connection_name: str = None, unive
             settings['terminal.integrated.profiles.linux'][profile_name] = profile_config
             needs_update = True
 
-    if needs_update:
+    if needs_update and json.dumps(settings, sort_keys=True) != original_settings:
         try:
             with open(settings_path, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, indent=4)
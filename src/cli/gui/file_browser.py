@@ -833,6 +833,8 @@ class DualPaneFileBrowser:
     def disconnect_remote(self):
         """Disconnect from remote repository"""
         if self.ssh_connection:
+            if hasattr(self.ssh_connection, 'close'):
+                self.ssh_connection.close()
             if hasattr(self.ssh_connection, 'cleanup_ssh'):
                 self.ssh_connection.cleanup_ssh(getattr(self.ssh_connection, 'ssh_key_file', None),
                                                getattr(self.ssh_connection, 'known_hosts_file', None))
@@ -891,8 +893,16 @@ class DualPaneFileBrowser:
             if not ssh_exe:
                 return False, "SSH executable not found"
             
-            # Pass SSH executable to setup_ssh for proper path handling
-            ssh_opts, ssh_key_file, known_hosts_file = self.ssh_connection.setup_ssh(ssh_exe)
+            if is_windows():
+                # Pass SSH executable to setup_ssh for proper path handling
+                ssh_opts, ssh_key_file, known_hosts_file = self.ssh_connection.setup_ssh(ssh_exe)
+
+                # Store SSH files for cleanup
+                self.ssh_connection.ssh_key_file = ssh_key_file
+                self.ssh_connection.known_hosts_file = known_hosts_file
+            else:
+                # Reuse the persistent session so each command rides the same SSH master
+                ssh_opts = self.ssh_connection.session().ssh_opts
 
             # Build SSH command with proper option parsing
             # On Windows, ssh_opts may contain MSYS2-formatted paths that need special handling
@@ -913,10 +923,6 @@ class DualPaneFileBrowser:
             self.logger.debug(f"[SSH] Executing: {ssh_cmd}")
             result = subprocess.run(ssh_cmd, capture_output=True, text=True, timeout=30)
 
-            # Store SSH files for cleanup
-            self.ssh_connection.ssh_key_file = ssh_key_file
-            self.ssh_connection.known_hosts_file = known_hosts_file
-
             if result.returncode == 0:
                 return True, result.stdout
             else:
@@ -1289,6 +1295,16 @@ class DualPaneFileBrowser:
                 for item_id in tree.selection()
                 for item in [tree.item(item_id)]]
     
+    def _setup_transfer_ssh(self) -> Tuple[str, Optional[str], Optional[str]]:
+        """Get SSH options for rsync plus any temp key files the caller must remove.
+
+        On POSIX the connection's persistent session is reused, so the private key
+        stays in ssh-agent memory rather than being written to disk per transfer.
+        """
+        if is_windows():
+            return self.ssh_connection.setup_ssh()
+        return self.ssh_connection.session().ssh_opts, None, None
+
     def perform_selective_rsync(self, local_paths: List[Tuple[str, bool]], remote_base: str,
                                 direction: str = 'upload', progress_callback=None) -> Tuple[bool, str]:
         """Perform selective rsync transfer for specific files/folders using corrected sync_main.py functions"""
@@ -1303,7 +1319,7 @@ class DualPaneFileBrowser:
                 return self.perform_folder_sync(local_paths[0][0], remote_base, direction, progress_callback)
 
             # Set up SSH using sync_main functionality
-            ssh_opts, ssh_key_file, known_hosts_file = self.ssh_connection.setup_ssh()
+            ssh_opts, ssh_key_file, known_hosts_file = self._setup_transfer_ssh()
             ssh_cmd = get_rsync_ssh_command(ssh_opts)
 
             # Get universal user if available
@@ -1458,10 +1474,7 @@ class DualPaneFileBrowser:
                     error_messages.append(f"{os.path.basename(local_path)}: {str(e)}")
 
             # Clean up SSH files
-            if ssh_key_file and os.path.exists(ssh_key_file):
-                os.unlink(ssh_key_file)
-            if known_hosts_file and os.path.exists(known_hosts_file):
-                os.unlink(known_hosts_file)
+            self.ssh_connection.cleanup_ssh(ssh_key_file, known_hosts_file)
 
             # Return results
             if success_count == len(local_paths):
@@ -1481,7 +1494,7 @@ class DualPaneFileBrowser:
             from cli.commands.sync_main import get_rsync_changes, parse_rsync_changes
             
             # Get SSH options
-            ssh_opts, ssh_key_file, known_hosts_file = self.ssh_connection.setup_ssh()
+            ssh_opts, ssh_key_file, known_hosts_file = self._setup_transfer_ssh()
             ssh_cmd = get_rsync_ssh_command(ssh_opts)
             
             # Get universal user if available
@@ -1581,10 +1594,7 @@ class DualPaneFileBrowser:
             process.wait()
             
             # Clean up SSH files
-            if ssh_key_file and os.path.exists(ssh_key_file):
-                os.unlink(ssh_key_file)
-            if known_hosts_file and os.path.exists(known_hosts_file):
-                os.unlink(known_hosts_file)
+            self.ssh_connection.cleanup_ssh(ssh_key_file, known_hosts_file)
             
             # Clear process reference
             self.current_transfer_process = None
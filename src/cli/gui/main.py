@@ -57,6 +57,7 @@ from cli.core.shared import (
     get_machine_info_with_team,
     get_machine_connection_info,
     get_ssh_key_from_vault,
+    clear_vault_caches,
     SSHConnection
 )
 
@@ -289,6 +290,7 @@ class MainWindow(BaseWindow):
             self.activity_status_label.config(text=i18n.get('authentication_expired'), fg=COLOR_ERROR)
             messagebox.showerror(i18n.get('error'), i18n.get('session_expired'))
             TokenManager.clear_token()
+            clear_vault_caches()
             self.root.destroy()
             launch_gui()
             return True
@@ -3168,6 +3170,7 @@ Version: 1.0.0
             # Unregister observer before closing
             i18n.unregister_observer(self.update_all_texts)
             TokenManager.clear_token()
+            clear_vault_caches()
             self.root.destroy()
             launch_gui()
     